@@ -1,5 +1,9 @@
 """Deterministic keyword-based clustering for holdings."""
 
+import hashlib
+import re
+from functools import lru_cache
+
 # Cluster definitions: keyword rules for assigning holdings to clusters
 CLUSTERS: dict[str, list[str]] = {
     "AI/Semiconductors": [
@@ -255,24 +259,49 @@ CLUSTERS: dict[str, list[str]] = {
 }
 
 
+# Flattened (keyword, cluster) rules in precedence order: earlier clusters win, and
+# within a cluster earlier keywords win
+_RULES: tuple[tuple[str, str], ...] = tuple(
+    (keyword, cluster) for cluster, keywords in CLUSTERS.items() for keyword in keywords
+)
+
+# Identifies this rule set, so clusters stored by an older one can be detected and redone
+RULES_FINGERPRINT = hashlib.sha256(repr(_RULES).encode()).hexdigest()[:16]
+
+# Names shorter than this cannot contain any keyword, so they skip the scan
+_MIN_KEYWORD_LENGTH = min(len(keyword) for keyword, _ in _RULES)
+
+# One alternation over every keyword, scanned in a single case-insensitive pass. Each
+# keyword gets its own group, so a match's lastindex is its (1-based) rule index. The
+# lookahead keeps matches zero-width so overlapping keywords are all reported; at each
+# position the alternation picks the highest-precedence keyword, so the minimum over all
+# positions is the rule a cluster-by-cluster substring scan would return.
+_KEYWORD_PATTERN = re.compile(
+    "(?=" + "|".join(f"({re.escape(keyword)})" for keyword, _ in _RULES) + ")",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=100_000)
 def assign_cluster(issuer_name: str) -> str:
     """
     Assign a holding to a cluster based on issuer name.
 
+    Results are memoized per name since the same issuers recur across quarters
+    and funds; use ``assign_cluster.cache_clear()`` to reset.
+
     Args:
         issuer_name: The issuer name from the 13F
 
     Returns:
         Cluster name, or "Other" if no match
     """
-    name_upper = issuer_name.upper()
-
-    for cluster, keywords in CLUSTERS.items():
-        for keyword in keywords:
-            if keyword in name_upper:
-                return cluster
-
-    return "Other"
+    if len(issuer_name) < _MIN_KEYWORD_LENGTH:
+        return "Other"
+    best = min((m.lastindex for m in _KEYWORD_PATTERN.finditer(issuer_name)), default=None)
+    if best is None:
+        return "Other"
+    return _RULES[best - 1][1]
 
 
 def cluster_holdings(
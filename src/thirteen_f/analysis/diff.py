@@ -1,15 +1,23 @@
 """Quarter-over-quarter diff engine."""
 
+import heapq
 import json
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 
 from ..config import Config
 from ..storage.database import Database
 from ..storage.models import FilingRecord, HoldingRecord
 
+_delta_value_usd = attrgetter("delta_value_usd")
+_growth_rate = attrgetter("growth_rate")
+_portfolio_impact = attrgetter("portfolio_impact")
 
-@dataclass
+
+@dataclass(slots=True)
 class PositionDiff:
     """Diff for a single position between two quarters."""
 
@@ -43,10 +51,11 @@ class PositionDiff:
     put_call: str | None = None  # "Put", "Call", or None for shares
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # All fields are scalars, so skip asdict()'s recursive deepcopy
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass
+@dataclass(slots=True)
 class QuarterDiff:
     """Complete diff between two quarters for a fund."""
 
@@ -123,24 +132,16 @@ class QuarterDiff:
     def save(self, path: Path) -> None:
         """Save to a JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(self.to_json())
+        # Encode straight into the file instead of building the whole string first
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
 
 
-def _holding_key(h: HoldingRecord) -> str:
+def _holding_key(h: HoldingRecord) -> tuple[str, str, str]:
     """Generate a key for matching holdings across periods."""
-    # Match on CUSIP + title + put/call to handle options correctly
-    put_call = h.put_call or "NONE"
-    return f"{h.cusip}|{h.title_of_class}|{put_call}"
-
-
-def _is_starter(weight: float | None, value: int | None, config: Config) -> bool:
-    """Determine if a position qualifies as a starter."""
-    if value is not None and value < config.starter_value_threshold:
-        return True
-    if weight is not None:
-        if config.starter_weight_min <= weight <= config.starter_weight_max:
-            return True
-    return False
+    # Match on CUSIP + title + put/call to handle options correctly. A tuple hashes
+    # the existing strings instead of formatting and hashing a new joined string.
+    return (h.cusip, h.title_of_class, h.put_call or "")
 
 
 def compute_quarter_diff(
@@ -167,7 +168,21 @@ def compute_quarter_diff(
     """
     holdings_prev = db.get_holdings_for_filing(filing_prev.id)
     holdings_now = db.get_holdings_for_filing(filing_now.id)
+    return _diff_holdings(
+        fund_id, fund_name, filing_prev, filing_now, holdings_prev, holdings_now, config
+    )
+
 
+def _diff_holdings(
+    fund_id: int,
+    fund_name: str,
+    filing_prev: FilingRecord,
+    filing_now: FilingRecord,
+    holdings_prev: list[HoldingRecord],
+    holdings_now: list[HoldingRecord],
+    config: Config,
+) -> QuarterDiff:
+    """Compute the diff between two quarters from already-loaded holdings."""
     total_prev = sum(h.value_usd for h in holdings_prev)
     total_now = sum(h.value_usd for h in holdings_now)
 
@@ -175,14 +190,42 @@ def compute_quarter_diff(
     prev_by_key = {_holding_key(h): h for h in holdings_prev}
     now_by_key = {_holding_key(h): h for h in holdings_now}
 
-    all_keys = set(prev_by_key.keys()) | set(now_by_key.keys())
-
-    diffs: list[PositionDiff] = []
-
-    for key in all_keys:
-        h_prev = prev_by_key.get(key)
-        h_now = now_by_key.get(key)
+    # Pair current holdings with their previous counterpart (if any), then add the
+    # exited ones. Each key is probed once and no key-union set is materialized.
+    pairs = chain(
+        ((prev_by_key.get(key), h_now) for key, h_now in now_by_key.items()),
+        ((h_prev, None) for key, h_prev in prev_by_key.items() if key not in now_by_key),
+    )
 
+    # Loop invariants, hoisted out of the per-position loop
+    starter_value_threshold = config.starter_value_threshold
+    starter_weight_min = config.starter_weight_min
+    starter_weight_max = config.starter_weight_max
+    has_prev_total = total_prev > 0
+
+    # Categories, filled in the same pass that classifies each position
+    new_positions: list[PositionDiff] = []
+    sold_out: list[PositionDiff] = []
+    increased: list[PositionDiff] = []
+    decreased: list[PositionDiff] = []
+    unchanged: list[PositionDiff] = []
+    by_change_type = {
+        "NEW": new_positions,
+        "EXIT": sold_out,
+        "INCREASE": increased,
+        "DECREASE": decreased,
+        "UNCHANGED": unchanged,
+    }
+
+    # Ranking candidates, collected in the same pass that computes each position
+    adds: list[PositionDiff] = []  # positive delta
+    cuts: list[PositionDiff] = []  # negative delta
+    adds_with_growth: list[PositionDiff] = []  # growth rate excludes NEW positions
+    cuts_with_growth: list[PositionDiff] = []
+    adds_with_impact: list[PositionDiff] = []
+    cuts_with_impact: list[PositionDiff] = []
+
+    for h_prev, h_now in pairs:
         prev_value = h_prev.value_usd if h_prev else None
         now_value = h_now.value_usd if h_now else None
         prev_shares = h_prev.shares_or_principal if h_prev else None
@@ -200,9 +243,7 @@ def compute_quarter_diff(
             growth_rate = (now_value - prev_value) / prev_value
 
         # Portfolio impact
-        portfolio_impact = None
-        if total_prev > 0:
-            portfolio_impact = delta_value / total_prev
+        portfolio_impact = delta_value / total_prev if has_prev_total else None
 
         # Classification
         if h_prev is None and h_now is not None:
@@ -216,8 +257,10 @@ def compute_quarter_diff(
         else:
             change_type = "UNCHANGED"
 
-        # Starter detection
-        is_starter = _is_starter(now_weight, now_value, config)
+        # Starter detection: small value, or weight within the starter band
+        is_starter = (now_value is not None and now_value < starter_value_threshold) or (
+            now_weight is not None and starter_weight_min <= now_weight <= starter_weight_max
+        )
 
         # Use the available holding for name/cusip
         ref = h_now or h_prev
@@ -239,42 +282,33 @@ def compute_quarter_diff(
             is_starter=is_starter,
             put_call=ref.put_call,
         )
-        diffs.append(diff)
-
-    # Categorize
-    new_positions = [d for d in diffs if d.change_type == "NEW"]
-    sold_out = [d for d in diffs if d.change_type == "EXIT"]
-    increased = [d for d in diffs if d.change_type == "INCREASE"]
-    decreased = [d for d in diffs if d.change_type == "DECREASE"]
-    unchanged = [d for d in diffs if d.change_type == "UNCHANGED"]
+        by_change_type[change_type].append(diff)
+
+        if delta_value > 0:
+            adds.append(diff)
+            if growth_rate is not None and change_type != "NEW":
+                adds_with_growth.append(diff)
+            if portfolio_impact is not None:
+                adds_with_impact.append(diff)
+        elif delta_value < 0:
+            cuts.append(diff)
+            if growth_rate is not None:
+                cuts_with_growth.append(diff)
+            if portfolio_impact is not None:
+                cuts_with_impact.append(diff)
 
     # Ranked lists (top 10)
-    # Adds by value (positive delta)
-    adds = [d for d in diffs if d.delta_value_usd > 0]
-    cuts = [d for d in diffs if d.delta_value_usd < 0]
+    # heapq.nlargest/nsmallest match sorted(...)[:10], ties included, without
+    # sorting the full list. The growth and impact candidates were only collected when
+    # the metric is set, so the keys never see None.
+    top_adds_by_value = heapq.nlargest(10, adds, key=_delta_value_usd)
+    top_cuts_by_value = heapq.nsmallest(10, cuts, key=_delta_value_usd)
 
-    top_adds_by_value = sorted(adds, key=lambda d: d.delta_value_usd, reverse=True)[:10]
-    top_cuts_by_value = sorted(cuts, key=lambda d: d.delta_value_usd)[:10]
+    top_adds_by_growth_rate = heapq.nlargest(10, adds_with_growth, key=_growth_rate)
+    top_cuts_by_growth_rate = heapq.nsmallest(10, cuts_with_growth, key=_growth_rate)
 
-    # Adds/cuts by growth rate (exclude NEW positions for growth rate)
-    adds_with_growth = [d for d in adds if d.growth_rate is not None and d.change_type != "NEW"]
-    cuts_with_growth = [d for d in cuts if d.growth_rate is not None]
-
-    top_adds_by_growth_rate = sorted(
-        adds_with_growth, key=lambda d: d.growth_rate or 0, reverse=True
-    )[:10]
-    top_cuts_by_growth_rate = sorted(cuts_with_growth, key=lambda d: d.growth_rate or 0)[:10]
-
-    # Adds/cuts by portfolio impact
-    adds_with_impact = [d for d in adds if d.portfolio_impact is not None]
-    cuts_with_impact = [d for d in cuts if d.portfolio_impact is not None]
-
-    top_adds_by_portfolio_impact = sorted(
-        adds_with_impact, key=lambda d: d.portfolio_impact or 0, reverse=True
-    )[:10]
-    top_cuts_by_portfolio_impact = sorted(
-        cuts_with_impact, key=lambda d: d.portfolio_impact or 0
-    )[:10]
+    top_adds_by_portfolio_impact = heapq.nlargest(10, adds_with_impact, key=_portfolio_impact)
+    top_cuts_by_portfolio_impact = heapq.nsmallest(10, cuts_with_impact, key=_portfolio_impact)
 
     # Starters
     new_starters = [d for d in new_positions if d.is_starter]
@@ -290,19 +324,19 @@ def compute_quarter_diff(
     ]
 
     # Diagnostics
-    # Concentration
-    weights_now = sorted(
-        [(h.value_usd / total_now) for h in holdings_now if total_now > 0], reverse=True
-    )
-    concentration_top5 = sum(weights_now[:5]) if len(weights_now) >= 5 else sum(weights_now)
-    concentration_top10 = sum(weights_now[:10]) if len(weights_now) >= 10 else sum(weights_now)
-
-    # Herfindahl index
-    herfindahl = sum(w * w for w in weights_now) if weights_now else 0.0
+    # Concentration and Herfindahl index, summed over integer values and divided once
+    concentration_top5 = 0.0
+    concentration_top10 = 0.0
+    herfindahl = 0.0
+    if total_now > 0:
+        values_now = sorted((h.value_usd for h in holdings_now), reverse=True)
+        concentration_top5 = sum(values_now[:5]) / total_now
+        concentration_top10 = sum(values_now[:10]) / total_now
+        herfindahl = sum(v * v for v in values_now) / (total_now * total_now)
 
     # Gross adds/cuts
-    gross_adds = sum(d.delta_value_usd for d in adds)
-    gross_cuts = sum(abs(d.delta_value_usd) for d in cuts)
+    gross_adds = sum(p.delta_value_usd for p in adds)
+    gross_cuts = -sum(p.delta_value_usd for p in cuts)
 
     return QuarterDiff(
         fund_id=fund_id,
@@ -334,15 +368,32 @@ def compute_quarter_diff(
     )
 
 
+def _diff_holdings_job(args: tuple) -> QuarterDiff:
+    """Process-pool entry point: unpack one pair's arguments for _diff_holdings."""
+    return _diff_holdings(*args)
+
+
 def compute_all_diffs(
     db: Database,
     fund_id: int,
     fund_name: str,
     config: Config,
+    max_workers: int = 1,
 ) -> list[QuarterDiff]:
     """
     Compute diffs for all adjacent quarter pairs for a fund.
 
+    Pairs are independent once holdings are loaded, so callers diffing very long
+    filing histories can opt into a process pool. Each diff takes milliseconds,
+    so for typical histories starting workers costs more than the diffs.
+
+    Args:
+        db: Database instance
+        fund_id: Fund ID
+        fund_name: Fund display name
+        config: Configuration
+        max_workers: Worker processes to use (default 1: run in-process)
+
     Returns:
         List of QuarterDiff objects, ordered from most recent to oldest
     """
@@ -350,11 +401,25 @@ def compute_all_diffs(
     if len(filings) < 2:
         return []
 
-    diffs = []
-    for i in range(len(filings) - 1):
-        filing_now = filings[i]
-        filing_prev = filings[i + 1]
-        diff = compute_quarter_diff(db, fund_id, fund_name, filing_prev, filing_now, config)
-        diffs.append(diff)
+    # Load every filing's holdings once: each filing is the "now" side of one pair and
+    # the "prev" side of the next
+    holdings = db.get_holdings_for_filings([f.id for f in filings])
+
+    jobs = [
+        (
+            fund_id,
+            fund_name,
+            filing_prev,
+            filing_now,
+            holdings[filing_prev.id],
+            holdings[filing_now.id],
+            config,
+        )
+        for filing_now, filing_prev in zip(filings, filings[1:])
+    ]
+
+    if max_workers <= 1:
+        return [_diff_holdings(*job) for job in jobs]
 
-    return diffs
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_diff_holdings_job, jobs))
@@ -1,11 +1,40 @@
 """Thesis signal detection across multiple quarters."""
 
+import re
+from collections import defaultdict
 from dataclasses import dataclass, field
+from enum import IntEnum
+from itertools import chain
+from operator import attrgetter
 
+from .clustering import assign_cluster
 from .diff import QuarterDiff
 
+# One-letter codes for change types. Each cusip's history is encoded as a string of
+# these, so the per-cusip patterns are matched by compiled regexes rather than
+# stepped through tuple by tuple in Python.
+_CHANGE_CODES = {"NEW": "N", "EXIT": "X", "INCREASE": "I", "DECREASE": "D", "UNCHANGED": "U"}
+_INCREASE_RUN = re.compile("I+")
+_NAMED_QUARTER = re.compile("[NID]")  # quarters whose issuer name labels the cusip
+_BUILD_THEN_TRIM = re.compile("I{2,}D")  # 2+ increases, then a decrease
+_PROBE = re.compile("(?=N.??(X))")  # opened, then closed within 2 quarters
 
-@dataclass
+
+class Strength(IntEnum):
+    """Signal strength. Members order strongest first, so signals sort by it directly."""
+
+    STRONG = 0
+    MODERATE = 1
+    WEAK = 2
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+
+@dataclass(slots=True)
 class Signal:
     """A detected thesis signal."""
 
@@ -13,10 +42,20 @@ class Signal:
     description: str
     holdings: list[str]  # List of issuer names
     quarters: list[str]  # List of periods involved
-    strength: str  # "weak", "moderate", "strong"
+    strength: Strength
     details: dict = field(default_factory=dict)
 
 
+def _position_name(codes: str, names: list[str]) -> str:
+    """
+    Name a cusip after the oldest quarter in which it was opened, added to or trimmed.
+
+    Every per-cusip pattern includes a NEW or INCREASE quarter, so a match is found
+    for any cusip that produced a signal.
+    """
+    return names[_NAMED_QUARTER.search(codes).start()]
+
+
 def detect_signals(diffs: list[QuarterDiff]) -> list[Signal]:
     """
     Detect thesis signals across multiple quarters.
@@ -30,171 +69,156 @@ def detect_signals(diffs: list[QuarterDiff]) -> list[Signal]:
     if not diffs:
         return []
 
-    signals: list[Signal] = []
+    # Each signal type collects into its own list; they are joined once, in type order,
+    # before the final sort
+    accumulator_signals: list[Signal] = []
+    build_trim_signals: list[Signal] = []
+    probe_signals: list[Signal] = []
+    concentration_signals: list[Signal] = []
+    theme_signals: list[Signal] = []
 
-    # Build position history: cusip -> list of (period, value, weight, change_type)
-    position_history: dict[str, list[tuple[str, int | None, float | None, str]]] = {}
+    # Build position history as parallel columns per cusip: the periods it appears in,
+    # the change code and the issuer name for each
+    position_periods: defaultdict[str, list[str]] = defaultdict(list)
+    position_codes: defaultdict[str, list[str]] = defaultdict(list)
+    position_names: defaultdict[str, list[str]] = defaultdict(list)
 
     for diff in reversed(diffs):  # Process oldest to newest
         period = diff.period_to
 
         # Track all positions in this period
-        all_positions = (
-            diff.new_positions
-            + diff.increased
-            + diff.decreased
-            + diff.unchanged
-            + diff.sold_out
-        )
-
-        for pos in all_positions:
+        for pos in chain(
+            diff.new_positions, diff.increased, diff.decreased, diff.unchanged, diff.sold_out
+        ):
             key = pos.cusip
-            if key not in position_history:
-                position_history[key] = []
-            position_history[key].append(
-                (period, pos.now_value_usd, pos.now_weight, pos.change_type)
-            )
+            position_periods[key].append(period)
+            position_codes[key].append(_CHANGE_CODES[pos.change_type])
+            position_names[key].append(pos.issuer_name)
+
+    # Signals 1-3 are per-cusip patterns, all matched in a single pass. The columns were
+    # filled in the same order, so their entries line up cusip by cusip.
+    for periods, code_list, names in zip(
+        position_periods.values(), position_codes.values(), position_names.values()
+    ):
+        # Every pattern spans at least two quarters; most cusips appear in only one
+        if len(periods) < 2:
+            continue
+        codes = "".join(code_list)
 
-    # Get issuer names mapping
-    cusip_to_name: dict[str, str] = {}
-    for diff in diffs:
-        for pos in diff.new_positions + diff.increased + diff.decreased:
-            cusip_to_name[pos.cusip] = pos.issuer_name
-
-    # 1. Consistent Accumulator: increased 3+ consecutive quarters
-    for cusip, history in position_history.items():
-        consecutive_increases = 0
-        max_consecutive = 0
-        increase_quarters = []
-
-        for period, value, weight, change_type in history:
-            if change_type == "INCREASE":
-                consecutive_increases += 1
-                increase_quarters.append(period)
-            else:
-                max_consecutive = max(max_consecutive, consecutive_increases)
-                consecutive_increases = 0
-                increase_quarters = []
-
-        max_consecutive = max(max_consecutive, consecutive_increases)
+        # 1. Consistent Accumulator: increased 3+ consecutive quarters
+        max_consecutive = max(map(len, _INCREASE_RUN.findall(codes)), default=0)
 
         if max_consecutive >= 3:
-            name = cusip_to_name.get(cusip, cusip)
-            strength = "strong" if max_consecutive >= 4 else "moderate"
-            signals.append(
+            name = _position_name(codes, names)
+            strength = Strength.STRONG if max_consecutive >= 4 else Strength.MODERATE
+            # Report the run of increases still open at the latest quarter, if any
+            run_start = len(codes.rstrip("I"))
+            quarters = periods[run_start:]
+            accumulator_signals.append(
                 Signal(
                     signal_type="consistent_accumulator",
                     description=f"{name} increased {max_consecutive} consecutive quarters",
                     holdings=[name],
-                    quarters=increase_quarters[-max_consecutive:],
+                    quarters=quarters,
                     strength=strength,
                     details={"consecutive_increases": max_consecutive},
                 )
             )
 
-    # 2. Build then Trim: increased 2+ quarters, then decreased
-    for cusip, history in position_history.items():
-        if len(history) < 3:
-            continue
+        # 2. Build then Trim: increased 2+ quarters, then decreased. The first
+        # INCREASE, INCREASE, ..., DECREASE pattern is reported.
+        match = _BUILD_THEN_TRIM.search(codes)
+        if match:
+            start, end = match.span()
+            build_len = end - start - 1
+            name = _position_name(codes, names)
+            build_trim_signals.append(
+                Signal(
+                    signal_type="build_then_trim",
+                    description=f"{name} built for {build_len} quarters then trimmed",
+                    holdings=[name],
+                    quarters=periods[start:end],
+                    strength=Strength.MODERATE,
+                    details={"build_quarters": build_len},
+                )
+            )
 
-        # Look for pattern: INCREASE, INCREASE, ..., DECREASE
-        build_quarters = []
-        in_build_phase = False
-
-        for i, (period, value, weight, change_type) in enumerate(history):
-            if change_type == "INCREASE":
-                build_quarters.append(period)
-                in_build_phase = True
-            elif change_type == "DECREASE" and in_build_phase and len(build_quarters) >= 2:
-                name = cusip_to_name.get(cusip, cusip)
-                signals.append(
-                    Signal(
-                        signal_type="build_then_trim",
-                        description=f"{name} built for {len(build_quarters)} quarters then trimmed",
-                        holdings=[name],
-                        quarters=build_quarters + [period],
-                        strength="moderate",
-                        details={"build_quarters": len(build_quarters)},
-                    )
+        # 3. One-Quarter Probe: opened and closed within 2 quarters
+        for match in _PROBE.finditer(codes):
+            i = match.start()
+            j = match.start(1)
+            name = _position_name(codes, names)
+            quarters_held = j - i + 1
+            probe_signals.append(
+                Signal(
+                    signal_type="one_quarter_probe",
+                    description=f"{name} opened and closed within {quarters_held} quarters",
+                    holdings=[name],
+                    quarters=[periods[i], periods[j]],
+                    strength=Strength.WEAK,
+                    details={"quarters_held": quarters_held},
                 )
-                break
-            else:
-                build_quarters = []
-                in_build_phase = False
-
-    # 3. One-Quarter Probe: opened and closed within 2 quarters
-    for cusip, history in position_history.items():
-        for i, (period, value, weight, change_type) in enumerate(history):
-            if change_type == "NEW":
-                # Check if exited within next 2 quarters
-                for j in range(i + 1, min(i + 3, len(history))):
-                    if history[j][3] == "EXIT":
-                        name = cusip_to_name.get(cusip, cusip)
-                        quarters_held = j - i + 1
-                        signals.append(
-                            Signal(
-                                signal_type="one_quarter_probe",
-                                description=f"{name} opened and closed within {quarters_held} quarters",
-                                holdings=[name],
-                                quarters=[history[i][0], history[j][0]],
-                                strength="weak",
-                                details={"quarters_held": quarters_held},
-                            )
-                        )
-                        break
+            )
 
     # 4. Concentration Shift: top-5 weight changed >5% between oldest and newest
     if len(diffs) >= 2:
         newest = diffs[0]
         oldest = diffs[-1]
 
-        conc_change = abs(newest.concentration_top5 - oldest.concentration_top5)
+        newest_top5 = newest.concentration_top5
+        oldest_top5 = oldest.concentration_top5
+        conc_change = abs(newest_top5 - oldest_top5)
         if conc_change >= 0.05:  # 5%
-            direction = "increased" if newest.concentration_top5 > oldest.concentration_top5 else "decreased"
-            signals.append(
+            direction = "increased" if newest_top5 > oldest_top5 else "decreased"
+            concentration_signals.append(
                 Signal(
                     signal_type="concentration_shift",
                     description=f"Top-5 concentration {direction} by {conc_change:.1%}",
                     holdings=[],
                     quarters=[oldest.period_to, newest.period_to],
-                    strength="moderate" if conc_change < 0.10 else "strong",
+                    strength=Strength.MODERATE if conc_change < 0.10 else Strength.STRONG,
                     details={
                         "concentration_change": conc_change,
                         "direction": direction,
-                        "from": oldest.concentration_top5,
-                        "to": newest.concentration_top5,
+                        "from": oldest_top5,
+                        "to": newest_top5,
                     },
                 )
             )
 
     # 5. Theme Emergence: 3+ new starters with same cluster in a quarter
-    from .clustering import assign_cluster
-
     for diff in diffs:
-        cluster_starters: dict[str, list[str]] = {}
+        cluster_starters: defaultdict[str, list[str]] = defaultdict(list)
         for pos in diff.new_starters:
             cluster = assign_cluster(pos.issuer_name)
             if cluster != "Other":
-                if cluster not in cluster_starters:
-                    cluster_starters[cluster] = []
                 cluster_starters[cluster].append(pos.issuer_name)
 
         for cluster, starters in cluster_starters.items():
             if len(starters) >= 3:
-                signals.append(
+                theme_signals.append(
                     Signal(
                         signal_type="theme_emergence",
                         description=f"{len(starters)} new starters in {cluster}",
                         holdings=starters,
                         quarters=[diff.period_to],
-                        strength="moderate" if len(starters) < 5 else "strong",
+                        strength=Strength.MODERATE if len(starters) < 5 else Strength.STRONG,
                         details={"cluster": cluster, "count": len(starters)},
                     )
                 )
 
+    signals = list(
+        chain(
+            accumulator_signals,
+            build_trim_signals,
+            probe_signals,
+            concentration_signals,
+            theme_signals,
+        )
+    )
+
     # Sort by strength (strong > moderate > weak)
-    strength_order = {"strong": 0, "moderate": 1, "weak": 2}
-    signals.sort(key=lambda s: strength_order.get(s.strength, 3))
+    signals.sort(key=attrgetter("strength"))
 
     return signals
 
@@ -226,11 +250,11 @@ def detect_starter_to_scale(diffs: list[QuarterDiff]) -> list[dict]:
     latest_diff = diffs[0]
     all_current = {
         pos.cusip: pos
-        for pos in (
-            latest_diff.new_positions
-            + latest_diff.increased
-            + latest_diff.decreased
-            + latest_diff.unchanged
+        for pos in chain(
+            latest_diff.new_positions,
+            latest_diff.increased,
+            latest_diff.decreased,
+            latest_diff.unchanged,
         )
     }
 
@@ -1,18 +1,53 @@
 """13F Analysis CLI."""
 
 import json
+import os
 import re
 import sys
+import time
 import uuid
-from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from .config import Config, Fund, get_config, load_funds, save_funds
+from .config import Config, Fund, get_config, index_funds, load_funds, save_funds
+
+# Commands import the EDGAR, storage and report modules they need when they run, so
+# that start-up (--help, fund list edits) doesn't pay for httpx and pandas
+if TYPE_CHECKING:
+    from datetime import date
+
+    from rich.console import Console
+
+    from .edgar.client import EdgarClient
+    from .edgar.parser import Holding
 
 __version__ = "0.1.0"
 
+# Tags: alphanumeric, hyphens, underscores
+_TAG_RE = re.compile(r"\A[\w\-]+\Z")
+
+# Characters that could break YAML or cause issues in fund names
+_FUND_NAME_INVALID_RE = re.compile(r"[:\n\r\t\x00]")
+
+# Replacements for escape_applescript_string: control characters that could break the
+# command become spaces (null bytes are dropped), backslashes are doubled, and quotes
+# are spliced in with the quote constant
+_APPLESCRIPT_ESCAPES = {
+    "\n": " ",
+    "\r": " ",
+    "\t": " ",
+    "\x00": "",
+    "\\": "\\\\",
+    '"': '" & quote & "',
+}
+_APPLESCRIPT_SPECIAL_RE = re.compile("[" + re.escape("".join(_APPLESCRIPT_ESCAPES)) + "]")
+
 
 def _get_lazy_config(ctx: click.Context) -> Config:
     """Get config lazily - only creates it when first accessed."""
@@ -21,11 +56,29 @@ def _get_lazy_config(ctx: click.Context) -> Config:
     return ctx.obj["config"]
 
 
+def _get_funds(ctx: click.Context) -> list[Fund]:
+    """Get the fund list lazily - loaded once and shared with commands run via ctx.invoke."""
+    if "funds" not in ctx.obj:
+        ctx.obj["funds"] = load_funds(_get_lazy_config(ctx))
+    return ctx.obj["funds"]
+
+
 # =============================================================================
 # Security Helpers
 # =============================================================================
 
 
+def _dir_prefix(path: Path) -> str:
+    """Resolve a directory to a string ending in a separator, for prefix checks."""
+    return os.path.join(path.resolve(), "")
+
+
+@lru_cache(maxsize=1)
+def _home_prefix() -> str:
+    """Prefix of the home directory, which stays fixed for the life of the process."""
+    return _dir_prefix(Path.home())
+
+
 def validate_output_path(output: str, config: Config) -> Path:
     """
     Validate that an output path is safe (no path traversal).
@@ -42,21 +95,19 @@ def validate_output_path(output: str, config: Config) -> Path:
     """
     output_path = Path(output).resolve()
 
-    # Allowed base directories
-    allowed_bases = [
-        config.base_dir.resolve(),
-        config.artifacts_dir.resolve(),
-        Path.cwd().resolve(),
-        Path.home().resolve(),
-    ]
+    # Allowed base directories. The working directory can change, so it is resolved on
+    # every call; the config directories come pre-resolved and home is resolved once.
+    allowed_prefixes = (
+        os.path.join(config.base_dir_resolved, ""),
+        os.path.join(config.artifacts_dir_resolved, ""),
+        _dir_prefix(Path.cwd()),
+        _home_prefix(),
+    )
 
-    # Check if path is under any allowed directory
-    for base in allowed_bases:
-        try:
-            output_path.relative_to(base)
-            return output_path
-        except ValueError:
-            continue
+    # Check if path is under any allowed directory. Comparing against separator-terminated
+    # prefixes keeps sibling directories such as "<base>-other" out.
+    if os.path.join(output_path, "").startswith(allowed_prefixes):
+        return output_path
 
     raise click.ClickException(
         f"Output path must be within the project directory, artifacts, "
@@ -81,12 +132,11 @@ def sanitize_fund_name(name: str) -> str:
         raise click.ClickException("Fund name must be 1-255 characters")
 
     # Disallow characters that could break YAML or cause issues
-    invalid_chars = [':', '\n', '\r', '\t', '\x00']
-    for char in invalid_chars:
-        if char in name:
-            raise click.ClickException(
-                f"Fund name contains invalid character: {repr(char)}"
-            )
+    invalid = _FUND_NAME_INVALID_RE.search(name)
+    if invalid:
+        raise click.ClickException(
+            f"Fund name contains invalid character: {repr(invalid.group())}"
+        )
 
     return name.strip()
 
@@ -112,7 +162,7 @@ def sanitize_tag(tag: str) -> str:
         raise click.ClickException(f"Tag too long (max 50 chars): {tag[:20]}...")
 
     # Only allow alphanumeric, hyphens, underscores
-    if not re.match(r'^[\w\-]+$', tag):
+    if not _TAG_RE.match(tag):
         raise click.ClickException(
             f"Tag contains invalid characters (only alphanumeric, -, _ allowed): {tag}"
         )
@@ -120,43 +170,46 @@ def sanitize_tag(tag: str) -> str:
     return tag
 
 
+def _applescript_escape(match: re.Match[str]) -> str:
+    return _APPLESCRIPT_ESCAPES[match.group()]
+
+
 def escape_applescript_string(s: str) -> str:
     """Escape a string for safe use in AppleScript.
 
     AppleScript escapes quotes by using the quote constant.
     Also escape backslashes and remove control characters for safety.
     """
-    # Remove/replace control characters that could break the command
-    s = s.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-    s = s.replace('\x00', '')  # Remove null bytes
-    # Escape backslashes and quotes
-    s = s.replace('\\', '\\\\')
-    s = s.replace('"', '" & quote & "')
-    return s
-
-
-from .edgar.client import EdgarClient
-from .edgar.parser import compute_filing_totals, parse_13f_info_table
-from .edgar.submissions import (
-    FilingInfo,
-    find_info_table_filename,
-    get_13f_filings,
-    get_latest_filing_period,
-    period_to_quarter,
-)
-from .reports.fund_report import generate_fund_report
-from .reports.universe import generate_universe_report
-from .storage.database import Database
-from .storage.exports import export_to_csv, export_to_parquet
-from .storage.models import FilingRecord, FundRecord
+    return _APPLESCRIPT_SPECIAL_RE.sub(_applescript_escape, s)
+
+
+@lru_cache(maxsize=1)
+def _get_rich() -> tuple[type, type]:
+    """
+    Import rich's Console and Table on first use.
+
+    rich is only needed by commands that render output, so it stays out of CLI
+    start-up for the rest.
+    """
+    from rich.console import Console
+    from rich.table import Table
+
+    return Console, Table
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Get the shared rich Console; creating one probes the terminal, so it's done once."""
+    Console, _ = _get_rich()
+    return Console()
 
 
 def _print_markdown(content: str) -> None:
     """Print markdown content with rich formatting."""
-    from rich.console import Console
+    # Markdown pulls in a markdown parser on top of rich, so only this path imports it
     from rich.markdown import Markdown
-    console = Console()
-    console.print(Markdown(content))
+
+    _get_console().print(Markdown(content))
 
 
 @click.group()
@@ -177,16 +230,15 @@ def cli(ctx: click.Context) -> None:
 def add_fund(ctx: click.Context, name: str, cik: str, tags: str) -> None:
     """Add a fund to the tracking list."""
     config = _get_lazy_config(ctx)
-    funds = load_funds(config)
+    funds = _get_funds(ctx)
 
     # Sanitize inputs
     name = sanitize_fund_name(name)
 
     # Check if fund already exists
-    for f in funds:
-        if f.display_name.lower() == name.lower():
-            click.echo(f"Fund '{name}' already exists.")
-            return
+    if name.lower() in index_funds(funds):
+        click.echo(f"Fund '{name}' already exists.")
+        return
 
     # Normalize and validate CIK (should be numeric)
     cik_clean = cik.lstrip("0")
@@ -194,17 +246,17 @@ def add_fund(ctx: click.Context, name: str, cik: str, tags: str) -> None:
         raise click.ClickException("CIK must be numeric")
     cik_normalized = cik_clean.zfill(10)
 
-    # Parse and sanitize tags
-    tag_list = []
-    if tags:
-        for t in tags.split(","):
-            sanitized = sanitize_tag(t)
-            if sanitized:
-                tag_list.append(sanitized)
+    # Parse and sanitize tags, dropping empties and repeats but keeping first-seen order
+    tag_list = (
+        list(dict.fromkeys(sanitized for t in tags.split(",") if (sanitized := sanitize_tag(t))))
+        if tags
+        else []
+    )
 
     fund = Fund(display_name=name, cik=cik_normalized, tags=tag_list)
     funds.append(fund)
     save_funds(config, funds)
+    ctx.obj.pop("funds", None)
 
     click.echo(f"Added fund: {name} (CIK: {cik_normalized})")
 
@@ -214,17 +266,20 @@ def add_fund(ctx: click.Context, name: str, cik: str, tags: str) -> None:
 @click.pass_context
 def remove_fund(ctx: click.Context, name: str) -> None:
     """Remove a fund from the tracking list."""
-    config = _get_lazy_config(ctx)
-    funds = load_funds(config)
+    from .storage.database import Database
 
-    original_count = len(funds)
-    funds = [f for f in funds if f.display_name.lower() != name.lower()]
+    config = _get_lazy_config(ctx)
+    funds = _get_funds(ctx)
 
-    if len(funds) == original_count:
+    name_lc = name.lower()
+    if name_lc not in index_funds(funds):
         click.echo(f"Fund '{name}' not found.")
         return
 
+    funds = [f for f in funds if f.display_name.lower() != name_lc]
+
     save_funds(config, funds)
+    ctx.obj.pop("funds", None)
 
     # Also remove from database
     with Database(config) as db:
@@ -237,17 +292,15 @@ def remove_fund(ctx: click.Context, name: str) -> None:
 @click.pass_context
 def list_funds(ctx: click.Context) -> None:
     """List all tracked funds."""
-    from rich.console import Console
-    from rich.table import Table
+    _, Table = _get_rich()
 
-    config = _get_lazy_config(ctx)
-    funds = load_funds(config)
+    funds = _get_funds(ctx)
 
     if not funds:
         click.echo("No funds configured. Use 'add-fund' to add funds.")
         return
 
-    console = Console()
+    console = _get_console()
     table = Table(title="Tracked Funds")
     table.add_column("Name", style="cyan")
     table.add_column("CIK")
@@ -260,6 +313,50 @@ def list_funds(ctx: click.Context) -> None:
     console.print(table)
 
 
+# Concurrent EDGAR requests in pull and check-new; EdgarClient still enforces the rate limit
+_FETCH_WORKERS = 8
+
+
+@contextmanager
+def _thread_pool(max_workers: int) -> Iterator[ThreadPoolExecutor]:
+    """
+    Run a ThreadPoolExecutor that drops its queued work if the block raises.
+
+    The executor's own exit waits for every submitted task, which under the SEC
+    rate limit can take minutes after a Ctrl-C. Tasks already running still finish.
+    """
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        yield pool
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+
+
+def _fetch_info_table(
+    client: "EdgarClient", cik: str, accession_number: str
+) -> tuple[list["Holding"] | None, str | None]:
+    """
+    Find, fetch and parse a filing's info table on one of pull's worker threads.
+
+    Returns:
+        Tuple of (holdings, None) on success, or (None, message) on failure
+    """
+    from .edgar.parser import parse_13f_info_table
+    from .edgar.submissions import find_info_table_filename
+
+    info_table_file = find_info_table_filename(client, cik, accession_number)
+    if not info_table_file:
+        return None, "Warning: Could not find info table file"
+
+    try:
+        xml_content = client.get_info_table_xml(cik, accession_number, info_table_file)
+        return parse_13f_info_table(xml_content), None
+    except Exception as e:
+        return None, f"Error parsing info table: {e}"
+
+
 @cli.command("pull")
 @click.option("--fund", "fund_name", help="Fund name to pull")
 @click.option("--all", "pull_all", is_flag=True, help="Pull all tracked funds and stocks")
@@ -276,8 +373,15 @@ def pull(
     skip_stocks: bool,
 ) -> None:
     """Pull 13F filings from SEC EDGAR."""
+    from .edgar.client import EdgarClient
+    from .edgar.parser import compute_filing_totals
+    from .edgar.submissions import get_13f_filings, period_to_quarter
+    from .storage.database import Database
+    from .storage.exports import export_to_csv, export_to_parquet
+    from .storage.models import FilingRecord, FundRecord
+
     config = _get_lazy_config(ctx)
-    funds = load_funds(config)
+    funds = _get_funds(ctx)
 
     if not funds:
         click.echo("No funds configured. Use 'add-fund' to add funds.")
@@ -291,18 +395,31 @@ def pull(
     if pull_all:
         target_funds = funds
     else:
-        target_funds = [f for f in funds if f.display_name.lower() == fund_name.lower()]
-        if not target_funds:
+        fund = index_funds(funds).get(fund_name.lower())
+        if not fund:
             click.echo(f"Fund '{fund_name}' not found.")
             return
+        target_funds = [fund]
 
     # Create run artifact directory
-    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    artifact_dir = config.artifacts_dir / run_id
+    run_id = time.strftime("%Y%m%d_%H%M%S")
+    artifact_dir = config.artifacts_dir_resolved / run_id
     artifact_dir.mkdir(parents=True, exist_ok=True)
 
-    with EdgarClient(config) as client, Database(config) as db:
-        for fund in target_funds:
+    with (
+        EdgarClient(config) as client,
+        Database(config) as db,
+        _thread_pool(_FETCH_WORKERS) as pool,
+    ):
+        # Look up every fund's filings at once; results are read in order
+        filing_lookups = [
+            pool.submit(
+                get_13f_filings, client, fund.cik, periods=periods, original_only=original_only
+            )
+            for fund in target_funds
+        ]
+
+        for fund, filing_lookup in zip(target_funds, filing_lookups):
             click.echo(f"\nPulling filings for {fund.display_name}...")
 
             # Ensure fund is in database
@@ -315,9 +432,7 @@ def pull(
             fund_id = db.upsert_fund(fund_record)
 
             try:
-                filings = get_13f_filings(
-                    client, fund.cik, periods=periods, original_only=original_only
-                )
+                filings = filing_lookup.result()
             except Exception as e:
                 click.echo(f"  Error fetching filings: {e}")
                 continue
@@ -328,32 +443,30 @@ def pull(
 
             click.echo(f"  Found {len(filings)} filing(s)")
 
+            existing = db.get_existing_accessions([f.accession_number for f in filings])
+
+            # Fetch new filings' info tables concurrently, then store them in order
+            fetches = {
+                f.accession_number: pool.submit(
+                    _fetch_info_table, client, fund.cik, f.accession_number
+                )
+                for f in filings
+                if f.accession_number not in existing
+            }
+
             for filing_info in filings:
                 quarter = period_to_quarter(filing_info.period_of_report)
 
                 # Check if already ingested
-                if db.filing_exists(filing_info.accession_number):
+                if filing_info.accession_number in existing:
                     click.echo(f"  {quarter}: Already ingested, skipping")
                     continue
 
                 click.echo(f"  {quarter}: Processing {filing_info.accession_number}...")
 
-                # Find info table file
-                info_table_file = find_info_table_filename(
-                    client, fund.cik, filing_info.accession_number
-                )
-                if not info_table_file:
-                    click.echo(f"    Warning: Could not find info table file")
-                    continue
-
-                # Fetch and parse info table
-                try:
-                    xml_content = client.get_info_table_xml(
-                        fund.cik, filing_info.accession_number, info_table_file
-                    )
-                    holdings = parse_13f_info_table(xml_content)
-                except Exception as e:
-                    click.echo(f"    Error parsing info table: {e}")
+                holdings, error = fetches[filing_info.accession_number].result()
+                if error:
+                    click.echo(f"    {error}")
                     continue
 
                 if not holdings:
@@ -374,10 +487,15 @@ def pull(
                     total_value_usd=total_value,
                     position_count=position_count,
                 )
-                filing_id = db.upsert_filing(filing_record)
 
-                # Store holdings
-                inserted = db.insert_holdings(filing_id, holdings)
+                # Store the filing and its holdings in one commit, before exporting: a
+                # failed export keeps the parsed filing (the next pull skips it, and
+                # `export` can redo the files), and a later failure cannot roll back a
+                # filing whose artifacts exist
+                with db.transaction():
+                    filing_id = db.upsert_filing(filing_record)
+                    inserted = db.insert_holdings(filing_id, holdings)
+                existing.add(filing_info.accession_number)
                 click.echo(f"    Stored {inserted} holdings (${total_value:,})")
 
                 # Export to artifacts
@@ -400,11 +518,14 @@ def pull(
 @click.pass_context
 def report(ctx: click.Context, fund_name: str, period: str, output: str | None) -> None:
     """Generate analysis report for a fund."""
+    from .reports.fund_report import generate_fund_report
+    from .storage.database import Database
+
     config = _get_lazy_config(ctx)
-    funds = load_funds(config)
+    funds = _get_funds(ctx)
 
     # Find fund
-    fund = next((f for f in funds if f.display_name.lower() == fund_name.lower()), None)
+    fund = index_funds(funds).get(fund_name.lower())
     if not fund:
         click.echo(f"Fund '{fund_name}' not found.")
         return
@@ -437,15 +558,16 @@ def report(ctx: click.Context, fund_name: str, period: str, output: str | None)
 def compare(ctx: click.Context, fund_name: str, from_period: str, to_period: str) -> None:
     """Compare two periods for a fund."""
     config = _get_lazy_config(ctx)
-    funds = load_funds(config)
+    funds = _get_funds(ctx)
 
-    fund = next((f for f in funds if f.display_name.lower() == fund_name.lower()), None)
+    fund = index_funds(funds).get(fund_name.lower())
     if not fund:
         click.echo(f"Fund '{fund_name}' not found.")
         return
 
     from .analysis.diff import compute_quarter_diff
     from .edgar.submissions import quarter_to_period
+    from .storage.database import Database
 
     with Database(config) as db:
         fund_record = db.get_fund_by_name(fund.display_name)
@@ -487,18 +609,20 @@ def universe_report(
     ctx: click.Context, funds: str, period: str, output: str | None
 ) -> None:
     """Generate cross-fund comparison report."""
+    from .reports.universe import generate_universe_report
+    from .storage.database import Database
+
     config = _get_lazy_config(ctx)
-    all_funds = load_funds(config)
+    all_funds = _get_funds(ctx)
 
     # Parse fund names
     fund_names_input = [f.strip() for f in funds.split(",")]
 
     # Find matching funds
+    funds_by_name = index_funds(all_funds)
     matched_funds = []
     for name in fund_names_input:
-        fund = next(
-            (f for f in all_funds if f.display_name.lower() == name.lower()), None
-        )
+        fund = funds_by_name.get(name.lower())
         if fund:
             matched_funds.append(fund)
         else:
@@ -557,10 +681,13 @@ def lookup_cik(ctx: click.Context, name: str) -> None:
 @click.pass_context
 def export(ctx: click.Context, fund_name: str, fmt: str, output: str | None) -> None:
     """Export fund data to CSV or Parquet."""
+    from .storage.database import Database
+    from .storage.exports import export_to_csv, export_to_parquet
+
     config = _get_lazy_config(ctx)
-    funds = load_funds(config)
+    funds = _get_funds(ctx)
 
-    fund = next((f for f in funds if f.display_name.lower() == fund_name.lower()), None)
+    fund = index_funds(funds).get(fund_name.lower())
     if not fund:
         click.echo(f"Fund '{fund_name}' not found.")
         return
@@ -568,7 +695,7 @@ def export(ctx: click.Context, fund_name: str, fmt: str, output: str | None) ->
     if output:
         output_path = validate_output_path(output, config)
     else:
-        output_path = config.artifacts_dir / "exports"
+        output_path = config.artifacts_dir_resolved / "exports"
     output_path.mkdir(parents=True, exist_ok=True)
 
     with Database(config) as db:
@@ -587,30 +714,40 @@ def export(ctx: click.Context, fund_name: str, fmt: str, output: str | None) ->
 
 
 def _send_notification(title: str, message: str) -> None:
-    """Send macOS notification."""
+    """
+    Send macOS notification.
+
+    Returns without waiting for osascript to post it. A daemon thread reaps the
+    process, so repeated checks leave no zombies behind.
+    """
     import subprocess
+    import threading
 
     # Escape strings to prevent AppleScript injection
     safe_title = escape_applescript_string(title)
     safe_message = escape_applescript_string(message)
 
-    subprocess.run(
+    # The notification is advisory, so don't block the command on it
+    process = subprocess.Popen(
         [
             "osascript",
             "-e",
             f'display notification "{safe_message}" with title "{safe_title}"',
         ],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
     )
+    threading.Thread(target=process.wait, daemon=True).start()
 
 
 def _update_tracked_stocks(config: Config) -> None:
     """Update data for all tracked stocks."""
     from .sec.quarterly_data import extract_cusip_holdings, get_available_quarters
     from .storage.stock_storage import (
+        get_all_stock_quarters,
         load_tracked_stocks,
         save_stock_holdings,
-        get_stock_quarters,
     )
 
     stocks = load_tracked_stocks(config)
@@ -625,11 +762,14 @@ def _update_tracked_stocks(config: Config) -> None:
         click.echo("  No quarterly data available.")
         return
 
+    # Quarters already stored, for every stock in one directory scan
+    stored_quarters = get_all_stock_quarters(config)
+
     for stock in stocks:
         click.echo(f"  {stock.ticker}:", nl=False)
 
         # Find quarters we don't have yet
-        existing_quarters = set(get_stock_quarters(stock.ticker, config))
+        existing_quarters = stored_quarters.get(stock.ticker.upper(), set())
         new_quarters = [q for q in quarters if q not in existing_quarters]
 
         if not new_quarters:
@@ -655,11 +795,14 @@ def _update_tracked_stocks(config: Config) -> None:
 @click.pass_context
 def check_new(ctx: click.Context, auto_pull: bool, send_notify: bool) -> None:
     """Check for new 13F filings not yet in database."""
-    from rich.console import Console
-    from rich.table import Table
+    from .edgar.client import EdgarClient
+    from .edgar.submissions import get_latest_filing_period
+    from .storage.database import Database
+
+    _, Table = _get_rich()
 
     config = _get_lazy_config(ctx)
-    funds = load_funds(config)
+    funds = _get_funds(ctx)
 
     if not funds:
         click.echo("No funds configured. Use 'add-fund' to add funds.")
@@ -667,7 +810,7 @@ def check_new(ctx: click.Context, auto_pull: bool, send_notify: bool) -> None:
 
     click.echo("Checking for new filings...\n")
 
-    console = Console()
+    console = _get_console()
     table = Table(title="13F Filing Status")
     table.add_column("Fund", style="cyan")
     table.add_column("Latest in DB")
@@ -677,8 +820,16 @@ def check_new(ctx: click.Context, auto_pull: bool, send_notify: bool) -> None:
     funds_with_new = []
     rows = []
 
-    with EdgarClient(config) as client, Database(config) as db:
-        for fund in funds:
+    with (
+        EdgarClient(config) as client,
+        Database(config) as db,
+        _thread_pool(_FETCH_WORKERS) as pool,
+    ):
+        # Look every fund up on SEC at once (revalidating cached submissions); results are
+        # read in order
+        sec_lookups = [pool.submit(get_latest_filing_period, client, fund.cik) for fund in funds]
+
+        for fund, sec_lookup in zip(funds, sec_lookups):
             fund_record = db.get_fund_by_name(fund.display_name)
 
             # Get latest from database
@@ -688,9 +839,9 @@ def check_new(ctx: click.Context, auto_pull: bool, send_notify: bool) -> None:
                 if latest_filing:
                     db_latest = latest_filing.period_of_report
 
-            # Get latest from SEC (bypass cache)
+            # Get latest from SEC
             try:
-                sec_latest = get_latest_filing_period(client, fund.cik)
+                sec_latest = sec_lookup.result()
                 if not sec_latest:
                     sec_latest = "-"
             except Exception as e:
@@ -745,16 +896,17 @@ def check_new(ctx: click.Context, auto_pull: bool, send_notify: bool) -> None:
             _send_notification("13F Check", "No new filings available.")
 
 
-@cli.command("calendar")
-def calendar() -> None:
-    """Show 13F filing calendar and expected dates."""
-    from datetime import date
+def _filing_calendar(year: int) -> list[tuple[str, "date", "date"]]:
+    """
+    Build a year's 13F filing calendar.
 
-    today = date.today()
-    year = today.year
+    Returns:
+        Tuples of (quarter label, period end date, filing deadline)
+    """
+    from datetime import date
 
     # Quarter end dates and filing deadlines
-    quarters = [
+    return [
         (f"Q4 {year - 1}", date(year - 1, 12, 31), date(year, 2, 14)),
         (f"Q1 {year}", date(year, 3, 31), date(year, 5, 15)),
         (f"Q2 {year}", date(year, 6, 30), date(year, 8, 14)),
@@ -762,10 +914,19 @@ def calendar() -> None:
         (f"Q4 {year}", date(year, 12, 31), date(year + 1, 2, 14)),
     ]
 
+
+@cli.command("calendar")
+def calendar() -> None:
+    """Show 13F filing calendar and expected dates."""
+    from datetime import date
+
+    today = date.today()
+    year = today.year
+
     click.echo(f"\n13F Filing Calendar ({year})")
     click.echo("-" * 50)
 
-    for quarter, period_end, deadline in quarters:
+    for quarter, period_end, deadline in _filing_calendar(year):
         # Check if we're in the filing window (after quarter end, before/at deadline)
         in_window = period_end < today <= deadline
         current_marker = " ← CURRENT WINDOW" if in_window else ""
@@ -779,7 +940,8 @@ def calendar() -> None:
             days_left = (deadline - today).days
             status = f"({days_left} days left)"
 
-        click.echo(f"{quarter} filings: due {deadline.strftime('%b %d, %Y')} {status}{current_marker}")
+        due = deadline.strftime("%b %d, %Y")
+        click.echo(f"{quarter} filings: due {due} {status}{current_marker}")
 
     click.echo("")
     click.echo("Most funds file 40-45 days after quarter end.")
@@ -839,6 +1001,34 @@ def schedule(enable: bool, disable: bool, show_status: bool, hour: int, minute:
 # ============================================================================
 
 
+# Quarterly data sets fetched at once by the stock commands
+_DOWNLOAD_WORKERS = 4
+
+
+def _download_stock_quarters(ticker: str, cusip: str, quarters: list[str], config: Config) -> None:
+    """
+    Extract and save a stock's holdings for each quarter.
+
+    The quarterly data sets download concurrently, but each is parsed and saved in
+    order on this thread, so only one large data set is held in memory at a time.
+    On Ctrl-C, downloads not yet started are cancelled rather than waited for.
+    """
+    from .sec.quarterly_data import download_quarterly_data, extract_cusip_holdings
+    from .storage.stock_storage import save_stock_holdings
+
+    with _thread_pool(_DOWNLOAD_WORKERS) as pool:
+        downloads = [pool.submit(download_quarterly_data, quarter, config) for quarter in quarters]
+        for quarter, download in zip(quarters, downloads):
+            click.echo(f"  {quarter}...", nl=False)
+            try:
+                download.result()
+                holdings = extract_cusip_holdings(quarter, cusip, config, min_value=50_000_000)
+                save_stock_holdings(ticker, quarter, holdings, config)
+                click.echo(f" {len(holdings)} holders")
+            except Exception as e:
+                click.echo(f" Error: {e}")
+
+
 @cli.command("stock")
 @click.argument("query")
 @click.option("--history", is_flag=True, help="Show quarterly history")
@@ -865,13 +1055,12 @@ def stock(
     """
     from .reports.stock_report import generate_stock_report, generate_stock_history_report
     from .sec.cusip_lookup import resolve_ticker_or_cusip, search_issuer_in_quarterly_data, save_cusip_mapping
-    from .sec.quarterly_data import extract_cusip_holdings, get_available_quarters
+    from .sec.quarterly_data import get_available_quarters
     from .storage.stock_storage import (
         add_tracked_stock,
         get_stock_storage_bytes,
         get_tracked_stock,
         load_stock_holdings,
-        save_stock_holdings,
         format_bytes,
         get_stock_quarters,
     )
@@ -929,15 +1118,7 @@ def stock(
         # Download data for all available quarters
         click.echo("Downloading quarterly data...")
         quarters = get_available_quarters()[:4]  # Last 4 quarters
-
-        for quarter in quarters:
-            click.echo(f"  {quarter}...", nl=False)
-            try:
-                holdings = extract_cusip_holdings(quarter, cusip, config, min_value=50_000_000)
-                save_stock_holdings(ticker, quarter, holdings, config)
-                click.echo(f" {len(holdings)} holders")
-            except Exception as e:
-                click.echo(f" Error: {e}")
+        _download_stock_quarters(ticker, cusip, quarters, config)
 
         click.echo("")
 
@@ -978,8 +1159,7 @@ def stock(
 @click.pass_context
 def list_stocks(ctx: click.Context) -> None:
     """List all tracked stocks."""
-    from rich.console import Console
-    from rich.table import Table
+    _, Table = _get_rich()
 
     from .storage.stock_storage import (
         load_tracked_stocks,
@@ -997,7 +1177,7 @@ def list_stocks(ctx: click.Context) -> None:
 
     storage_info = get_total_stock_storage(config)
 
-    console = Console()
+    console = _get_console()
     table = Table(title=f"Tracked Stocks ({len(stocks)} total, {format_bytes(storage_info['total_bytes'])})")
     table.add_column("Ticker", style="cyan")
     table.add_column("Name")
@@ -1032,11 +1212,10 @@ def add_stock_cmd(ctx: click.Context, ticker: str, cusip: str | None, name: str
     Useful for adding stocks with known CUSIPs.
     """
     from .sec.cusip_lookup import resolve_ticker_or_cusip, save_cusip_mapping
-    from .sec.quarterly_data import extract_cusip_holdings, get_available_quarters
+    from .sec.quarterly_data import get_available_quarters
     from .storage.stock_storage import (
         add_tracked_stock,
         get_tracked_stock,
-        save_stock_holdings,
         format_bytes,
     )
 
@@ -1071,15 +1250,7 @@ def add_stock_cmd(ctx: click.Context, ticker: str, cusip: str | None, name: str
     # Download data
     click.echo("Downloading quarterly data...")
     quarters = get_available_quarters()[:4]
-
-    for quarter in quarters:
-        click.echo(f"  {quarter}...", nl=False)
-        try:
-            holdings = extract_cusip_holdings(quarter, cusip, config, min_value=50_000_000)
-            save_stock_holdings(ticker, quarter, holdings, config)
-            click.echo(f" {len(holdings)} holders")
-        except Exception as e:
-            click.echo(f" Error: {e}")
+    _download_stock_quarters(ticker, cusip, quarters, config)
 
     click.echo(f"\n{ticker} is now being tracked.")
 
@@ -7,6 +7,14 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Parsed fund entries by funds file, with the (mtime_ns, size) they were read at
+_FUNDS_CACHE: dict[Path, tuple[tuple[int, int], list[dict]]] = {}
+
 
 def _get_user_agent() -> str:
     """Get User-Agent for SEC EDGAR. SEC requires contact info."""
@@ -31,6 +39,9 @@ class Config:
     artifacts_dir: Path = field(init=False)
     db_path: Path = field(init=False)
     funds_file: Path = field(init=False)
+    # Symlink-free absolute forms, resolved once for path checks and run artifacts
+    base_dir_resolved: Path = field(init=False)
+    artifacts_dir_resolved: Path = field(init=False)
 
     # SEC EDGAR settings
     user_agent: str = field(default_factory=_get_user_agent)
@@ -54,6 +65,9 @@ class Config:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
 
+        self.base_dir_resolved = self.base_dir.resolve()
+        self.artifacts_dir_resolved = self.artifacts_dir.resolve()
+
 
 @dataclass
 class Fund:
@@ -80,23 +94,45 @@ def load_funds(config: Config) -> list[Fund]:
     # Ensure default funds exist on first run
     _ensure_default_funds(config)
 
-    if not config.funds_file.exists():
+    try:
+        stat = config.funds_file.stat()
+    except FileNotFoundError:
         return []
 
-    with open(config.funds_file) as f:
-        data = yaml.safe_load(f) or {}
-
-    funds_data = data.get("funds", [])
+    # Only re-parse the file when it has changed since the last load
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _FUNDS_CACHE.get(config.funds_file)
+    if cached is not None and cached[0] == stamp:
+        funds_data = cached[1]
+    else:
+        with open(config.funds_file) as f:
+            data = yaml.load(f, Loader=SafeLoader) or {}
+        funds_data = data.get("funds", [])
+        _FUNDS_CACHE[config.funds_file] = (stamp, funds_data)
+
+    # Build fresh Funds so callers can't modify the cached entries
     return [
         Fund(
             display_name=fd["display_name"],
             cik=fd["cik"],
-            tags=fd.get("tags", []),
+            tags=list(fd.get("tags", [])),
         )
         for fd in funds_data
     ]
 
 
+def index_funds(funds: list[Fund]) -> dict[str, Fund]:
+    """
+    Index funds by lowercased display name, for case-insensitive lookup.
+
+    If two funds share a name, the first one listed wins.
+    """
+    index: dict[str, Fund] = {}
+    for fund in funds:
+        index.setdefault(fund.display_name.lower(), fund)
+    return index
+
+
 def save_funds(config: Config, funds: list[Fund]) -> None:
     """Save funds to the YAML config file."""
     data = {
@@ -111,6 +147,7 @@ def save_funds(config: Config, funds: list[Fund]) -> None:
     }
     with open(config.funds_file, "w") as f:
         yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    _FUNDS_CACHE.pop(config.funds_file, None)
 
 
 def get_config() -> Config:
@@ -1,14 +1,30 @@
 """SEC EDGAR HTTP client with rate limiting and caching."""
 
+import gzip
 import hashlib
 import json
+import threading
 import time
+import zlib
+from collections import OrderedDict
 from pathlib import Path
 
 import httpx
 
 from ..config import Config
 
+# Cached responses at least this large are stored gzip-compressed. SEC XML and HTML
+# shrink several-fold; smaller entries would mostly gain framing overhead.
+_COMPRESS_MIN_BYTES = 4096
+
+# Revalidated responses fetched or confirmed this recently are used without asking
+# SEC again, e.g. when pull follows check-new
+_REVALIDATE_MAX_AGE_SECONDS = 60.0
+
+# Total size of the responses each client keeps in memory, so repeated requests
+# within a run skip the disk cache
+_MEMO_MAX_BYTES = 32 * 1024 * 1024
+
 
 class EdgarClient:
     """HTTP client for SEC EDGAR with rate limiting and disk caching."""
@@ -19,8 +35,15 @@ class EdgarClient:
     def __init__(self, config: Config) -> None:
         self.config = config
         self.cache_dir = config.cache_dir
-        self._last_request_time: float = 0.0
-        self._min_request_interval = 1.0 / config.rate_limit_per_second
+        # Monotonic nanoseconds, so wall-clock changes can't stall or burst requests
+        self._last_request_ns = 0
+        self._min_request_interval_ns = int(1e9 / config.rate_limit_per_second)
+        self._rate_lock = threading.Lock()
+
+        # Recently used responses by URL, least recently used first
+        self._memo: OrderedDict[str, bytes] = OrderedDict()
+        self._memo_bytes = 0
+        self._memo_lock = threading.Lock()
 
         self._client = httpx.Client(
             headers={
@@ -32,34 +55,130 @@ class EdgarClient:
         )
 
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        """
+        Enforce rate limiting between requests.
+
+        Safe to call from several threads: each caller reserves the next request
+        slot under a lock, then sleeps until it outside the lock.
+        """
+        with self._rate_lock:
+            now = time.monotonic_ns()
+            wait = self._last_request_ns + self._min_request_interval_ns - now
+            self._last_request_ns = now + max(wait, 0)
+        if wait > 0:
+            time.sleep(wait / 1e9)
 
     def _cache_key(self, url: str) -> str:
-        """Generate a cache key for a URL."""
+        """Generate a cache key for a URL (BLAKE2b, which is cheaper than SHA-256)."""
+        return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+
+    @staticmethod
+    def _legacy_cache_key(url: str) -> str:
+        """Cache key used before the switch to BLAKE2b, for migrating old entries."""
         return hashlib.sha256(url.encode()).hexdigest()[:16]
 
     def _get_cache_path(self, url: str, suffix: str = ".json") -> Path:
         """Get the cache file path for a URL."""
         return self.cache_dir / f"{self._cache_key(url)}{suffix}"
 
+    @staticmethod
+    def _compressed_path(cache_path: Path) -> Path:
+        """Get the path of the gzip-compressed form of a cache entry."""
+        return cache_path.with_name(f"{cache_path.name}.gz")
+
+    @staticmethod
+    def _meta_path(cache_path: Path) -> Path:
+        """Get the path of the validators (ETag, Last-Modified) saved for a cache entry."""
+        return cache_path.with_name(f"{cache_path.name}.meta.json")
+
+    def _memo_get(self, url: str) -> bytes | None:
+        """Get a response held in memory, marking it most recently used."""
+        with self._memo_lock:
+            data = self._memo.get(url)
+            if data is not None:
+                self._memo.move_to_end(url)
+            return data
+
+    def _memo_put(self, url: str, data: bytes) -> None:
+        """Hold a response in memory, evicting the least recently used to stay in budget."""
+        if len(data) > _MEMO_MAX_BYTES:
+            return
+        with self._memo_lock:
+            old = self._memo.pop(url, None)
+            if old is not None:
+                self._memo_bytes -= len(old)
+            self._memo[url] = data
+            self._memo_bytes += len(data)
+            while self._memo_bytes > _MEMO_MAX_BYTES:
+                _, evicted = self._memo.popitem(last=False)
+                self._memo_bytes -= len(evicted)
+
     def _read_cache(self, url: str, suffix: str = ".json") -> bytes | None:
         """Read cached response if it exists."""
         cache_path = self._get_cache_path(url, suffix)
-        if cache_path.exists():
-            return cache_path.read_bytes()
-        return None
+        try:
+            return gzip.decompress(self._compressed_path(cache_path).read_bytes())
+        except (OSError, EOFError, zlib.error):
+            # Not stored compressed, or the entry is unreadable
+            pass
 
-    def _write_cache(self, url: str, data: bytes, suffix: str = ".json") -> None:
-        """Write response to cache."""
+        try:
+            return cache_path.read_bytes()
+        except FileNotFoundError:
+            pass
+
+        # Move an entry cached under the old key, rather than fetching it again
+        legacy_path = self.cache_dir / f"{self._legacy_cache_key(url)}{suffix}"
+        try:
+            legacy_path.replace(cache_path)
+        except FileNotFoundError:
+            return None
+        return cache_path.read_bytes()
+
+    def _read_cache_meta(self, url: str, suffix: str = ".json") -> dict:
+        """Read the validators and fetch time saved with a cached response, if any."""
+        try:
+            return json.loads(self._meta_path(self._get_cache_path(url, suffix)).read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(
+        self,
+        url: str,
+        data: bytes,
+        suffix: str = ".json",
+        headers: httpx.Headers | None = None,
+    ) -> None:
+        """Write response to cache, compressing large responses."""
         cache_path = self._get_cache_path(url, suffix)
-        cache_path.write_bytes(data)
-
-    def get(self, url: str, use_cache: bool = True, cache_suffix: str = ".json") -> bytes:
+        compressed_path = self._compressed_path(cache_path)
+        if len(data) >= _COMPRESS_MIN_BYTES:
+            compressed_path.write_bytes(gzip.compress(data, compresslevel=3, mtime=0))
+            # Drop any plain copy from before
+            cache_path.unlink(missing_ok=True)
+        else:
+            cache_path.write_bytes(data)
+            compressed_path.unlink(missing_ok=True)
+
+        # Keep the validators and fetch time for revalidating this entry later
+        meta_path = self._meta_path(cache_path)
+        if headers is None:
+            meta_path.unlink(missing_ok=True)
+            return
+        meta = {"fetched_at": time.time()}
+        if etag := headers.get("etag"):
+            meta["etag"] = etag
+        if last_modified := headers.get("last-modified"):
+            meta["last_modified"] = last_modified
+        meta_path.write_text(json.dumps(meta))
+
+    def get(
+        self,
+        url: str,
+        use_cache: bool = True,
+        cache_suffix: str = ".json",
+        revalidate: bool = False,
+    ) -> bytes:
         """
         Fetch a URL with rate limiting and optional caching.
 
@@ -67,39 +186,74 @@ class EdgarClient:
             url: The URL to fetch
             use_cache: Whether to use disk cache
             cache_suffix: File suffix for cache file
+            revalidate: Check a cached response is current with a conditional GET,
+                for URLs whose content changes (e.g. submissions), unless it was
+                fetched or checked within the last minute
 
         Returns:
             Response content as bytes
         """
-        # Check cache first
+        # Check memory, then the disk cache
+        cached = None
+        request_headers = {}
         if use_cache:
+            if not revalidate:
+                cached = self._memo_get(url)
+                if cached is not None:
+                    return cached
             cached = self._read_cache(url, cache_suffix)
             if cached is not None:
-                return cached
+                if not revalidate:
+                    self._memo_put(url, cached)
+                    return cached
+                # Without a sidecar (e.g. cached before validators were kept) the entry's
+                # age is unknown, so fall through to a full GET
+                meta = self._read_cache_meta(url, cache_suffix)
+                fetched_at = meta.get("fetched_at")
+                if (
+                    fetched_at is not None
+                    and time.time() - fetched_at < _REVALIDATE_MAX_AGE_SECONDS
+                ):
+                    self._memo_put(url, cached)
+                    return cached
+                if "etag" in meta:
+                    request_headers["If-None-Match"] = meta["etag"]
+                if "last_modified" in meta:
+                    request_headers["If-Modified-Since"] = meta["last_modified"]
 
         # Rate limit and fetch
         self._rate_limit()
-        response = self._client.get(url)
+        response = self._client.get(url, headers=request_headers)
+        if response.status_code == 304 and cached is not None and request_headers:
+            # Unchanged since it was cached; only headers were sent
+            meta["fetched_at"] = time.time()
+            self._meta_path(self._get_cache_path(url, cache_suffix)).write_text(json.dumps(meta))
+            self._memo_put(url, cached)
+            return cached
         response.raise_for_status()
 
-        # Cache the response
+        # Cache the response, keeping validators only for URLs that get revalidated
         if use_cache:
-            self._write_cache(url, response.content, cache_suffix)
+            self._write_cache(
+                url, response.content, cache_suffix, response.headers if revalidate else None
+            )
+            self._memo_put(url, response.content)
 
         return response.content
 
-    def get_json(self, url: str, use_cache: bool = True) -> dict:
+    def get_json(self, url: str, use_cache: bool = True, revalidate: bool = False) -> dict:
         """Fetch and parse JSON from a URL."""
-        data = self.get(url, use_cache=use_cache, cache_suffix=".json")
+        data = self.get(url, use_cache=use_cache, cache_suffix=".json", revalidate=revalidate)
         return json.loads(data)
 
-    def get_submissions(self, cik: str, use_cache: bool = True) -> dict:
+    def get_submissions(self, cik: str, use_cache: bool = True, revalidate: bool = False) -> dict:
         """
         Fetch the submissions JSON for a CIK.
 
         Args:
             cik: The CIK number (with or without leading zeros)
             use_cache: Whether to use disk cache (default True)
+            revalidate: Whether to check a cached copy is current (default False)
 
         Returns:
             Submissions data as dict
@@ -107,7 +261,7 @@ class EdgarClient:
         # Normalize CIK to 10 digits with leading zeros
         cik_normalized = cik.lstrip("0").zfill(10)
         url = f"{self.BASE_URL}/submissions/CIK{cik_normalized}.json"
-        return self.get_json(url, use_cache=use_cache)
+        return self.get_json(url, use_cache=use_cache, revalidate=revalidate)
 
     def get_filing_index(self, cik: str, accession_number: str) -> str:
         """
@@ -1,11 +1,12 @@
 """Parser for 13F information table XML files."""
 
 from dataclasses import dataclass
+from io import BytesIO
 
 from lxml import etree
 
 
-@dataclass
+@dataclass(slots=True)
 class Holding:
     """A single holding from a 13F filing."""
 
@@ -36,44 +37,10 @@ NAMESPACES = {
 }
 
 
-def _get_text(element: etree._Element, xpath: str, default: str = "") -> str:
-    """Extract text from an element using xpath, with namespace handling."""
-    # Try with namespace
-    for prefix in ["ns:", "ns1:", ""]:
-        try:
-            result = element.xpath(f"{prefix}{xpath}", namespaces=NAMESPACES)
-            if result:
-                if isinstance(result[0], etree._Element):
-                    return (result[0].text or "").strip()
-                return str(result[0]).strip()
-        except Exception:
-            continue
-
-    # Try direct child lookup
-    for child in element:
-        local_name = etree.QName(child).localname
-        if local_name.lower() == xpath.lower():
-            return (child.text or "").strip()
-
-    return default
-
-
-def _get_int(element: etree._Element, xpath: str, default: int = 0) -> int:
-    """Extract integer from an element using xpath."""
-    text = _get_text(element, xpath)
-    if not text:
-        return default
-    # Remove commas and other formatting
-    text = text.replace(",", "").replace(" ", "")
-    try:
-        return int(text)
-    except ValueError:
-        return default
-
-
 def _normalize_text(text: str) -> str:
     """Normalize text: strip whitespace, consistent casing."""
-    return " ".join(text.split()).strip()
+    # split() already drops leading and trailing whitespace
+    return " ".join(text.split())
 
 
 def _normalize_cusip(cusip: str) -> str:
@@ -93,89 +60,102 @@ def parse_13f_info_table(xml_content: bytes) -> list[Holding]:
     """
     holdings: list[Holding] = []
 
+    # Stream infoTable entries, in whatever namespace the filer used, instead of
+    # building the whole tree. Parse securely to prevent XXE attacks
+    # - resolve_entities=False: Don't resolve external entities
+    # - no_network=True: Don't fetch external resources
+    # - dtd_validation=False: Don't process DTD
+    context = etree.iterparse(
+        BytesIO(xml_content),
+        events=("end",),
+        tag="{*}infoTable",
+        resolve_entities=False,
+        no_network=True,
+        dtd_validation=False,
+    )
+
     try:
-        # Use secure parser to prevent XXE attacks
-        # - resolve_entities=False: Don't resolve external entities
-        # - no_network=True: Don't fetch external resources
-        # - dtd_validation=False: Don't process DTD
-        parser = etree.XMLParser(
-            resolve_entities=False,
-            no_network=True,
-            dtd_validation=False,
-        )
-        root = etree.fromstring(xml_content, parser=parser)
+        for _, info_table in context:
+            holding = _parse_info_table_entry(info_table)
+            if holding:
+                holdings.append(holding)
+
+            # Free the parsed entry and everything before it
+            info_table.clear()
+            while info_table.getprevious() is not None:
+                del info_table.getparent()[0]
     except etree.XMLSyntaxError as e:
         raise ValueError(f"Failed to parse XML: {e}")
 
-    # Find all infoTable entries - try different namespace patterns
-    info_tables = []
-
-    # Try various XPath patterns to find the info table entries
-    patterns = [
-        ".//ns:infoTable",
-        ".//ns1:infoTable",
-        ".//{http://www.sec.gov/edgar/document/thirteenf/informationtable}infoTable",
-        ".//infoTable",
-    ]
-
-    for pattern in patterns:
-        try:
-            info_tables = root.xpath(pattern, namespaces=NAMESPACES)
-            if info_tables:
-                break
-        except Exception:
-            continue
-
-    # Fallback: iterate through all children
-    if not info_tables:
-        for child in root.iter():
-            if etree.QName(child).localname == "infoTable":
-                info_tables.append(child)
-
-    for info_table in info_tables:
-        holding = _parse_info_table_entry(info_table)
-        if holding:
-            holdings.append(holding)
-
     return holdings
 
 
+def _child_texts(element: etree._Element) -> dict[str, str]:
+    """
+    Map the local names of an element's children to their stripped text.
+
+    Names are lowercased so lookups ignore case and namespace; if a name repeats,
+    the first child wins. Comments and processing instructions are skipped.
+    """
+    texts: dict[str, str] = {}
+    for child in element.iterchildren(etree.Element):
+        texts.setdefault(child.tag.rpartition("}")[2].lower(), (child.text or "").strip())
+    return texts
+
+
+def _to_int(text: str | None, default: int = 0) -> int:
+    """Convert a reported number to int, ignoring commas and spaces."""
+    if not text:
+        return default
+    # Remove commas and other formatting
+    text = text.replace(",", "").replace(" ", "")
+    try:
+        return int(text)
+    except ValueError:
+        return default
+
+
 def _parse_info_table_entry(entry: etree._Element) -> Holding | None:
-    """Parse a single infoTable entry."""
+    """Parse a single infoTable entry in one pass over its children."""
     try:
-        # Extract basic fields
-        issuer_name = _get_text(entry, "nameOfIssuer")
-        title_of_class = _get_text(entry, "titleOfClass")
-        cusip = _get_text(entry, "cusip")
+        fields: dict[str, str] = {}
+        shares: dict[str, str] | None = None
+        voting: dict[str, str] | None = None
+
+        for child in entry.iterchildren(etree.Element):
+            name = child.tag.rpartition("}")[2].lower()
+            if name == "shrsorprnamt":
+                if shares is None:
+                    shares = _child_texts(child)
+            elif name == "votingauthority":
+                if voting is None:
+                    voting = _child_texts(child)
+            else:
+                fields.setdefault(name, (child.text or "").strip())
 
+        # Extract basic fields
+        cusip = fields.get("cusip", "")
         if not cusip:
             return None
 
         # FIGI is optional
-        figi = _get_text(entry, "figi") or None
+        figi = fields.get("figi") or None
 
         # Value - SEC reports in thousands of dollars
-        value_raw = _get_int(entry, "value")
-        value_thousands = value_raw
-        value_usd = value_raw * 1000  # Convert from thousands to actual USD
-
-        # Shares/principal amount - look in shrsOrPrnAmt sub-element
-        shares_or_principal = 0
-        shares_type = "SH"
-
-        for child in entry.iter():
-            local_name = etree.QName(child).localname
-            if local_name == "shrsOrPrnAmt":
-                shares_or_principal = _get_int(child, "sshPrnamt")
-                shares_type = _get_text(child, "sshPrnamtType", "SH").upper()
-                break
-            elif local_name == "sshPrnamt":
-                shares_or_principal = _get_int(entry, "sshPrnamt")
-            elif local_name == "sshPrnamtType":
-                shares_type = _get_text(entry, "sshPrnamtType", "SH").upper()
+        value_thousands = _to_int(fields.get("value"))
+        value_usd = value_thousands * 1000  # Convert from thousands to actual USD
+
+        # Shares/principal amount - normally in a shrsOrPrnAmt sub-element, though some
+        # filers put the fields directly on the entry
+        if shares is None:
+            shares = fields
+        if voting is None:
+            voting = {}
+        shares_or_principal = _to_int(shares.get("sshprnamt"))
+        shares_type = shares.get("sshprnamttype", "SH").upper()
 
         # Put/Call
-        put_call_raw = _get_text(entry, "putCall")
+        put_call_raw = fields.get("putcall")
         put_call = None
         if put_call_raw:
             put_call_upper = put_call_raw.upper()
@@ -184,25 +164,9 @@ def _parse_info_table_entry(entry: etree._Element) -> Holding | None:
             elif "CALL" in put_call_upper:
                 put_call = "Call"
 
-        # Investment discretion
-        investment_discretion = _get_text(entry, "investmentDiscretion", "SOLE").upper()
-
-        # Voting authority - look in votingAuthority sub-element
-        voting_sole = 0
-        voting_shared = 0
-        voting_none = 0
-
-        for child in entry.iter():
-            local_name = etree.QName(child).localname
-            if local_name == "votingAuthority":
-                voting_sole = _get_int(child, "Sole")
-                voting_shared = _get_int(child, "Shared")
-                voting_none = _get_int(child, "None")
-                break
-
         return Holding(
-            issuer_name=_normalize_text(issuer_name),
-            title_of_class=_normalize_text(title_of_class),
+            issuer_name=_normalize_text(fields.get("nameofissuer", "")),
+            title_of_class=_normalize_text(fields.get("titleofclass", "")),
             cusip=_normalize_cusip(cusip),
             figi=figi,
             value_thousands=value_thousands,
@@ -210,10 +174,10 @@ def _parse_info_table_entry(entry: etree._Element) -> Holding | None:
             shares_or_principal=shares_or_principal,
             shares_type=shares_type,
             put_call=put_call,
-            investment_discretion=investment_discretion,
-            voting_sole=voting_sole,
-            voting_shared=voting_shared,
-            voting_none=voting_none,
+            investment_discretion=fields.get("investmentdiscretion", "SOLE").upper(),
+            voting_sole=_to_int(voting.get("sole")),
+            voting_shared=_to_int(voting.get("shared")),
+            voting_none=_to_int(voting.get("none")),
         )
 
     except Exception:
@@ -2,10 +2,20 @@
 
 import re
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date
+from urllib.parse import quote_plus
 
 from .client import EdgarClient
 
+# XML document links on a filing index page
+_XML_HREF_RE = re.compile(r'href="([^"]+\.xml)"', re.IGNORECASE)
+
+# Quarter notation, e.g. "2025Q3"
+_QUARTER_RE = re.compile(r"(\d{4})Q([1-4])")
+
+# SEC full-text search for 13F filers, formatted with the URL-encoded query
+_SEARCH_URL = "https://efts.sec.gov/LATEST/search-index?q={}&dateRange=custom&forms=13F-HR"
+
 
 @dataclass
 class FilingInfo:
@@ -37,7 +47,8 @@ def get_13f_filings(
     Returns:
         List of FilingInfo objects, sorted by period_of_report descending
     """
-    submissions = client.get_submissions(cik)
+    # Submissions gain entries as funds file, so confirm the cached copy is current
+    submissions = client.get_submissions(cik, revalidate=True)
 
     # Extract filing data from recent filings
     recent = submissions.get("filings", {}).get("recent", {})
@@ -50,41 +61,34 @@ def get_13f_filings(
     primary_documents = recent.get("primaryDocument", [])
     report_dates = recent.get("reportDate", [])
 
-    # Collect all 13F-HR and 13F-HR/A filings
-    filings: list[FilingInfo] = []
+    # Select the latest 13F-HR or 13F-HR/A filing per period in one pass
+    # (amendments supersede originals)
+    by_period: dict[str, FilingInfo] = {}
     for i, form_type in enumerate(form_types):
         if form_type not in ("13F-HR", "13F-HR/A"):
             continue
 
-        if original_only and form_type == "13F-HR/A":
+        is_amendment = form_type == "13F-HR/A"
+        if original_only and is_amendment:
             continue
 
-        filings.append(
-            FilingInfo(
-                accession_number=accession_numbers[i],
-                form_type=form_type,
-                filing_date=filing_dates[i],
-                period_of_report=report_dates[i],
-                is_amendment=form_type == "13F-HR/A",
-                primary_document=primary_documents[i],
-            )
-        )
-
-    # Group by period_of_report and select the latest filing per period
-    # (amendments supersede originals)
-    by_period: dict[str, FilingInfo] = {}
-    for f in filings:
-        period = f.period_of_report
-        if period not in by_period:
-            by_period[period] = f
-        else:
+        period = report_dates[i]
+        existing = by_period.get(period)
+        if existing is not None:
             # Prefer amendment over original, or later filing date
-            existing = by_period[period]
-            if f.is_amendment and not existing.is_amendment:
-                by_period[period] = f
-            elif f.is_amendment == existing.is_amendment:
-                if f.filing_date > existing.filing_date:
-                    by_period[period] = f
+            if existing.is_amendment and not is_amendment:
+                continue
+            if existing.is_amendment == is_amendment and filing_dates[i] <= existing.filing_date:
+                continue
+
+        by_period[period] = FilingInfo(
+            accession_number=accession_numbers[i],
+            form_type=form_type,
+            filing_date=filing_dates[i],
+            period_of_report=period,
+            is_amendment=is_amendment,
+            primary_document=primary_documents[i],
+        )
 
     # Sort by period descending and take the requested number
     sorted_filings = sorted(by_period.values(), key=lambda x: x.period_of_report, reverse=True)
@@ -109,34 +113,38 @@ def find_info_table_filename(client: EdgarClient, cik: str, accession_number: st
         return None
 
     # Extract all XML file hrefs
-    xml_hrefs = re.findall(r'href="([^"]+\.xml)"', index_html, re.IGNORECASE)
+    xml_hrefs = _XML_HREF_RE.findall(index_html)
 
-    # Extract just filenames (last component of path)
-    xml_files = []
+    # Extract just filenames (last component of path), with their lowercased form
+    xml_files: list[tuple[str, str]] = []
+    seen: set[str] = set()
     for href in xml_hrefs:
-        filename = href.split("/")[-1]
+        filename = href.rpartition("/")[2]
         # Skip duplicates and styled versions in xsl* directories
-        if filename not in [f for f, _ in xml_files] and "/xsl" not in href.lower():
-            xml_files.append((filename, href))
-
-    # Priority 1: Look for infotable patterns
-    for filename, href in xml_files:
-        lower = filename.lower()
+        if filename in seen or "/xsl" in href.lower():
+            continue
+        seen.add(filename)
+        xml_files.append((filename, filename.lower()))
+
+    # Rank each file once and keep the first of the best rank:
+    # 1. infotable patterns
+    # 2. form13f_*.xml (holdings table used by some filers)
+    # 3. any XML that's not primary_doc
+    best_filename = None
+    best_priority = 4
+    for filename, lower in xml_files:
         if "infotable" in lower or "information" in lower:
             return filename
+        if lower.startswith("form13f_"):
+            priority = 2
+        elif "primary" not in lower:
+            priority = 3
+        else:
+            continue
+        if priority < best_priority:
+            best_filename, best_priority = filename, priority
 
-    # Priority 2: Look for form13f_*.xml (holdings table used by some filers)
-    for filename, href in xml_files:
-        if filename.lower().startswith("form13f_") and filename.lower().endswith(".xml"):
-            return filename
-
-    # Priority 3: Any XML that's not primary_doc
-    for filename, href in xml_files:
-        lower = filename.lower()
-        if "primary" not in lower:
-            return filename
-
-    return None
+    return best_filename
 
 
 def get_latest_filing_period(client: EdgarClient, cik: str) -> str | None:
@@ -150,8 +158,8 @@ def get_latest_filing_period(client: EdgarClient, cik: str) -> str | None:
     Returns:
         Period of report string (e.g., "2024-12-31") or None if no filings
     """
-    # Bypass cache to get fresh data
-    submissions = client.get_submissions(cik, use_cache=False)
+    # Get fresh data; an unchanged copy is confirmed without downloading it again
+    submissions = client.get_submissions(cik, revalidate=True)
 
     recent = submissions.get("filings", {}).get("recent", {})
     if not recent:
@@ -181,7 +189,7 @@ def lookup_cik_by_name(client: EdgarClient, company_name: str) -> list[tuple[str
     """
     # Use the SEC company search endpoint
     # Note: This is a simplified approach; the actual SEC search is more complex
-    search_url = f"https://efts.sec.gov/LATEST/search-index?q={company_name}&dateRange=custom&forms=13F-HR"
+    search_url = _SEARCH_URL.format(quote_plus(company_name))
 
     try:
         # This endpoint may not work exactly like this - it's a best-effort lookup
@@ -210,9 +218,10 @@ def period_to_quarter(period_of_report: str) -> str:
     Returns:
         Quarter string like "2025Q3"
     """
-    date = datetime.strptime(period_of_report, "%Y-%m-%d")
-    quarter = (date.month - 1) // 3 + 1
-    return f"{date.year}Q{quarter}"
+    # fromisoformat is C-implemented and far cheaper than strptime
+    period = date.fromisoformat(period_of_report)
+    quarter = (period.month - 1) // 3 + 1
+    return f"{period.year}Q{quarter}"
 
 
 def quarter_to_period(quarter: str) -> str:
@@ -225,7 +234,7 @@ def quarter_to_period(quarter: str) -> str:
     Returns:
         Date string "YYYY-MM-DD" (end of quarter)
     """
-    match = re.match(r"(\d{4})Q([1-4])", quarter)
+    match = _QUARTER_RE.match(quarter)
     if not match:
         raise ValueError(f"Invalid quarter format: {quarter}")
 
@@ -1,15 +1,30 @@
 """Fund report generator."""
 
-from datetime import datetime
+from collections import defaultdict
+from datetime import date, datetime, timezone
 from pathlib import Path
 
 from ..analysis.clustering import assign_cluster, cluster_holdings, summarize_clusters
 from ..analysis.diff import QuarterDiff, compute_all_diffs
-from ..analysis.signals import Signal, detect_signals, detect_starter_to_scale
+from ..analysis.signals import Signal, Strength, detect_signals, detect_starter_to_scale
 from ..config import Config
 from ..storage.database import Database
 from ..storage.models import FilingRecord, HoldingRecord
 
+# Header rows of the tables the Changes section repeats for adds and cuts
+_VALUE_CHANGE_TABLE = (
+    "| Issuer | Prev Value | Now Value | Δ Value | Classification |",
+    "|--------|------------|-----------|---------|----------------|",
+)
+_GROWTH_RATE_TABLE = (
+    "| Issuer | Prev → Now | Growth Rate | Portfolio Impact |",
+    "|--------|------------|-------------|------------------|",
+)
+_PORTFOLIO_IMPACT_TABLE = (
+    "| Issuer | Prev Weight → Now Weight | Portfolio Impact |",
+    "|--------|--------------------------|------------------|",
+)
+
 
 def _format_value(value: int) -> str:
     """Format a USD value for display."""
@@ -96,6 +111,8 @@ def generate_fund_report(
 
     holdings = db.get_holdings_for_filing(filing.id)
     total_value = sum(h.value_usd for h in holdings)
+    # Weights are value_usd * inv_total, with the empty-portfolio check done once
+    inv_total = 1 / total_value if total_value else 0.0
 
     # Compute diffs
     diffs = compute_all_diffs(db, fund_id, fund_name, config)
@@ -122,24 +139,30 @@ def generate_fund_report(
     lines.append("")
 
     # Portfolio Map
-    lines.append("## Portfolio Map")
-    lines.append("")
+    lines.extend(["## Portfolio Map", ""])
 
     # Top 10 Holdings
-    lines.append("### Top 10 Holdings")
-    lines.append("")
-    lines.append("| Rank | Issuer | CUSIP | Value | Weight | Cluster |")
-    lines.append("|------|--------|-------|-------|--------|---------|")
+    lines.extend(
+        [
+            "### Top 10 Holdings",
+            "",
+            "| Rank | Issuer | CUSIP | Value | Weight | Cluster |",
+            "|------|--------|-------|-------|--------|---------|",
+        ]
+    )
+
+    # Change in value by position, looked up for each top holding
+    deltas: dict[tuple[str, str | None], int] = {}
+    if latest_diff:
+        for positions in (latest_diff.increased, latest_diff.decreased, latest_diff.new_positions):
+            for pos in positions:
+                deltas.setdefault((pos.cusip, pos.put_call), pos.delta_value_usd)
 
     for i, h in enumerate(holdings[:10], 1):
-        weight = h.value_usd / total_value if total_value else 0
+        weight = h.value_usd * inv_total
         cluster = assign_cluster(h.issuer_name)
-        delta_str = ""
-        if latest_diff:
-            for pos in latest_diff.increased + latest_diff.decreased + latest_diff.new_positions:
-                if pos.cusip == h.cusip and pos.put_call == h.put_call:
-                    delta_str = f" ({_format_change(pos.delta_value_usd)})"
-                    break
+        delta = deltas.get((h.cusip, h.put_call))
+        delta_str = f" ({_format_change(delta)})" if delta is not None else ""
         issuer_display = _format_holding_with_option(h)
         lines.append(
             f"| {i} | {issuer_display}{delta_str} | {h.cusip} | "
@@ -156,7 +179,7 @@ def generate_fund_report(
         lines.append("| Issuer | Type | Value | Weight | Shares/Contracts |")
         lines.append("|--------|------|-------|--------|------------------|")
         for h in sorted(options_holdings, key=lambda x: x.value_usd, reverse=True):
-            weight = h.value_usd / total_value if total_value else 0
+            weight = h.value_usd * inv_total
             lines.append(
                 f"| {h.issuer_name} | **{h.put_call.upper()}** | "
                 f"{_format_value(h.value_usd)} | {_format_weight(weight)} | "
@@ -169,26 +192,33 @@ def generate_fund_report(
         lines.append("### Holdings #11-30 by Cluster")
         lines.append("")
 
-        mid_holdings = [
-            (_format_holding_with_option(h), h.value_usd, h.value_usd / total_value if total_value else 0)
-            for h in holdings[10:30]
-        ]
-        cluster_summary = summarize_clusters([(h.issuer_name, h.value_usd, h.value_usd / total_value if total_value else 0) for h in holdings[10:30]])
+        mid_holdings = holdings[10:30]
+        cluster_summary = summarize_clusters(
+            [(h.issuer_name, h.value_usd, h.value_usd * inv_total) for h in mid_holdings]
+        )
+
+        # Group display names by cluster once, rather than filtering per cluster
+        names_by_cluster: dict[str, list[str]] = defaultdict(list)
+        for h in mid_holdings:
+            names_by_cluster[assign_cluster(h.issuer_name)].append(_format_holding_with_option(h))
 
         for cluster, value, weight, count in cluster_summary:
-            holdings_in_cluster = [h[0] for h in mid_holdings if assign_cluster(h[0].split(" (")[0]) == cluster]
-            names = ", ".join(holdings_in_cluster[:5])
-            if len(holdings_in_cluster) > 5:
-                names += f" +{len(holdings_in_cluster) - 5} more"
+            holdings_in_cluster = names_by_cluster[cluster]
+            extra = len(holdings_in_cluster) - 5
+            names = ", ".join(holdings_in_cluster[:5]) + (f" +{extra} more" if extra > 0 else "")
             lines.append(f"- **{cluster}** ({count} positions, {_format_weight(weight)}): {names}")
 
         lines.append("")
 
     # Notable Small Positions
-    lines.append("### Notable Small Positions")
-    lines.append("")
-    lines.append("*Positions with weight ≤0.25% that show interesting activity*")
-    lines.append("")
+    lines.extend(
+        [
+            "### Notable Small Positions",
+            "",
+            "*Positions with weight ≤0.25% that show interesting activity*",
+            "",
+        ]
+    )
 
     small_positions = []
     if latest_diff:
@@ -237,13 +267,9 @@ def generate_fund_report(
         lines.append("")
 
         # By Dollar Value
-        lines.append("### By Dollar Value")
-        lines.append("")
-        lines.append("**Top Adds:**")
-        lines.append("")
+        lines.extend(["### By Dollar Value", "", "**Top Adds:**", ""])
         if latest_diff.top_adds_by_value:
-            lines.append("| Issuer | Prev Value | Now Value | Δ Value | Classification |")
-            lines.append("|--------|------------|-----------|---------|----------------|")
+            lines.extend(_VALUE_CHANGE_TABLE)
             for pos in latest_diff.top_adds_by_value[:5]:
                 classification = _classify_position(pos)
                 issuer_display = _format_issuer_with_option(pos.issuer_name, pos.put_call)
@@ -252,13 +278,9 @@ def generate_fund_report(
                     f"{_format_value(pos.now_value_usd or 0)} | {_format_change(pos.delta_value_usd)} | "
                     f"{classification} |"
                 )
-        lines.append("")
-
-        lines.append("**Top Cuts:**")
-        lines.append("")
+        lines.extend(["", "**Top Cuts:**", ""])
         if latest_diff.top_cuts_by_value:
-            lines.append("| Issuer | Prev Value | Now Value | Δ Value | Classification |")
-            lines.append("|--------|------------|-----------|---------|----------------|")
+            lines.extend(_VALUE_CHANGE_TABLE)
             for pos in latest_diff.top_cuts_by_value[:5]:
                 classification = _classify_position(pos)
                 issuer_display = _format_issuer_with_option(pos.issuer_name, pos.put_call)
@@ -270,15 +292,18 @@ def generate_fund_report(
         lines.append("")
 
         # By Growth Rate
-        lines.append("### By Growth Rate")
-        lines.append("")
-        lines.append("*Excludes new positions (infinite growth)*")
-        lines.append("")
-        lines.append("**Top Adds:**")
-        lines.append("")
+        lines.extend(
+            [
+                "### By Growth Rate",
+                "",
+                "*Excludes new positions (infinite growth)*",
+                "",
+                "**Top Adds:**",
+                "",
+            ]
+        )
         if latest_diff.top_adds_by_growth_rate:
-            lines.append("| Issuer | Prev → Now | Growth Rate | Portfolio Impact |")
-            lines.append("|--------|------------|-------------|------------------|")
+            lines.extend(_GROWTH_RATE_TABLE)
             for pos in latest_diff.top_adds_by_growth_rate[:5]:
                 issuer_display = _format_issuer_with_option(pos.issuer_name, pos.put_call)
                 lines.append(
@@ -286,13 +311,9 @@ def generate_fund_report(
                     f"{_format_value(pos.now_value_usd or 0)} | {_format_pct_change(pos.growth_rate)} | "
                     f"{_format_pct_change(pos.portfolio_impact)} |"
                 )
-        lines.append("")
-
-        lines.append("**Top Cuts:**")
-        lines.append("")
+        lines.extend(["", "**Top Cuts:**", ""])
         if latest_diff.top_cuts_by_growth_rate:
-            lines.append("| Issuer | Prev → Now | Growth Rate | Portfolio Impact |")
-            lines.append("|--------|------------|-------------|------------------|")
+            lines.extend(_GROWTH_RATE_TABLE)
             for pos in latest_diff.top_cuts_by_growth_rate[:5]:
                 issuer_display = _format_issuer_with_option(pos.issuer_name, pos.put_call)
                 lines.append(
@@ -303,26 +324,18 @@ def generate_fund_report(
         lines.append("")
 
         # By Portfolio Impact
-        lines.append("### By Portfolio Impact")
-        lines.append("")
-        lines.append("**Top Adds:**")
-        lines.append("")
+        lines.extend(["### By Portfolio Impact", "", "**Top Adds:**", ""])
         if latest_diff.top_adds_by_portfolio_impact:
-            lines.append("| Issuer | Prev Weight → Now Weight | Portfolio Impact |")
-            lines.append("|--------|--------------------------|------------------|")
+            lines.extend(_PORTFOLIO_IMPACT_TABLE)
             for pos in latest_diff.top_adds_by_portfolio_impact[:5]:
                 issuer_display = _format_issuer_with_option(pos.issuer_name, pos.put_call)
                 lines.append(
                     f"| {issuer_display} | {_format_weight(pos.prev_weight)} → "
                     f"{_format_weight(pos.now_weight)} | {_format_pct_change(pos.portfolio_impact)} |"
                 )
-        lines.append("")
-
-        lines.append("**Top Cuts:**")
-        lines.append("")
+        lines.extend(["", "**Top Cuts:**", ""])
         if latest_diff.top_cuts_by_portfolio_impact:
-            lines.append("| Issuer | Prev Weight → Now Weight | Portfolio Impact |")
-            lines.append("|--------|--------------------------|------------------|")
+            lines.extend(_PORTFOLIO_IMPACT_TABLE)
             for pos in latest_diff.top_cuts_by_portfolio_impact[:5]:
                 issuer_display = _format_issuer_with_option(pos.issuer_name, pos.put_call)
                 lines.append(
@@ -332,14 +345,13 @@ def generate_fund_report(
         lines.append("")
 
     # Thesis Signals
-    lines.append("## Thesis Signals")
-    lines.append("")
-    lines.append("*Pattern-based signals detected across the last 4 quarters*")
-    lines.append("")
+    lines.extend(
+        ["## Thesis Signals", "", "*Pattern-based signals detected across the last 4 quarters*", ""]
+    )
 
     if signals:
         for signal in signals:
-            strength_emoji = {"strong": "🔴", "moderate": "🟡", "weak": "⚪"}.get(
+            strength_emoji = {Strength.STRONG: "🔴", Strength.MODERATE: "🟡"}.get(
                 signal.strength, "⚪"
             )
             lines.append(f"### {strength_emoji} {signal.signal_type.replace('_', ' ').title()}")
@@ -409,7 +421,7 @@ def generate_fund_report(
 
     # Footer
     lines.append("---")
-    lines.append(f"*Report generated: {datetime.utcnow().isoformat()}*")
+    lines.append(f"*Report generated: {datetime.now(timezone.utc).isoformat(timespec='seconds')}*")
 
     return "\n".join(lines)
 
@@ -417,9 +429,9 @@ def generate_fund_report(
 def _period_to_quarter(period: str) -> str:
     """Convert YYYY-MM-DD to YYYYQN format."""
     try:
-        date = datetime.strptime(period, "%Y-%m-%d")
-        quarter = (date.month - 1) // 3 + 1
-        return f"{date.year}Q{quarter}"
+        period_date = date.fromisoformat(period)
+        quarter = (period_date.month - 1) // 3 + 1
+        return f"{period_date.year}Q{quarter}"
     except ValueError:
         return period
 
@@ -1,7 +1,7 @@
 """Stock-centric report generator."""
 
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timezone
 
 from ..config import Config, load_funds
 from ..sec.quarterly_data import HoldingRecord
@@ -212,7 +212,7 @@ def generate_stock_report(
 
     # Footer
     lines.append("---")
-    lines.append(f"*Report generated: {datetime.utcnow().isoformat()}*")
+    lines.append(f"*Report generated: {datetime.now(timezone.utc).isoformat(timespec='seconds')}*")
 
     return "\n".join(lines)
 
@@ -383,6 +383,6 @@ def generate_stock_history_report(
 
     # Footer
     lines.append("---")
-    lines.append(f"*Report generated: {datetime.utcnow().isoformat()}*")
+    lines.append(f"*Report generated: {datetime.now(timezone.utc).isoformat(timespec='seconds')}*")
 
     return "\n".join(lines)
@@ -1,9 +1,9 @@
 """Cross-fund universe report generator."""
 
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timezone
+from itertools import chain
 
-from ..analysis.clustering import assign_cluster
 from ..analysis.diff import compute_all_diffs
 from ..config import Config
 from ..storage.database import Database
@@ -35,7 +35,7 @@ def generate_universe_report(
     lines.append("# 13F Universe Report")
     lines.append("")
     lines.append(f"**Funds Analyzed:** {', '.join(fund_names)}")
-    lines.append(f"**Generated:** {datetime.utcnow().isoformat()}")
+    lines.append(f"**Generated:** {datetime.now(timezone.utc).isoformat(timespec='seconds')}")
     lines.append("")
 
     # Collect data for each fund
@@ -197,10 +197,10 @@ def generate_universe_report(
     for fund_id, data in fund_data.items():
         if not data["diff"]:
             continue
-        for pos in data["diff"].increased + data["diff"].new_positions:
+        for pos in chain(data["diff"].increased, data["diff"].new_positions):
             key = f"{pos.cusip}|{pos.put_call or ''}"
             position_changes[key][data["name"]] = ("ADD", pos.delta_value_usd)
-        for pos in data["diff"].decreased + data["diff"].sold_out:
+        for pos in chain(data["diff"].decreased, data["diff"].sold_out):
             key = f"{pos.cusip}|{pos.put_call or ''}"
             position_changes[key][data["name"]] = ("CUT", pos.delta_value_usd)
 
@@ -303,11 +303,8 @@ def generate_universe_report(
     fund_clusters: dict[str, dict[str, float]] = {}
 
     for fund_id, data in fund_data.items():
-        cluster_values: dict[str, int] = defaultdict(int)
-        for h in data["holdings"]:
-            cluster = assign_cluster(h.issuer_name)
-            cluster_values[cluster] += h.value_usd
-            all_clusters.add(cluster)
+        cluster_values = db.get_cluster_values_for_filing(data["filing"].id)
+        all_clusters.update(cluster_values)
 
         fund_clusters[data["name"]] = {
             c: v / data["total_value"] if data["total_value"] else 0
@@ -335,6 +332,6 @@ def generate_universe_report(
 
     # Footer
     lines.append("---")
-    lines.append(f"*Report generated: {datetime.utcnow().isoformat()}*")
+    lines.append(f"*Report generated: {datetime.now(timezone.utc).isoformat(timespec='seconds')}*")
 
     return "\n".join(lines)
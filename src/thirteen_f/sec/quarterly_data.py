@@ -16,6 +16,9 @@ from ..config import Config
 # Base URL for SEC 13F data sets
 SEC_DATA_URL = "https://www.sec.gov/files/structureddata/data/form-13f-data-sets"
 
+# Size of the chunks quarterly data sets are streamed to disk in
+_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
 # Mapping of reporting quarters to data set date ranges
 # 13F filings are due 45 days after quarter end, so:
 # Q1 (Mar 31) → filings due May 15 → data in Mar-May set
@@ -141,16 +144,25 @@ def download_quarterly_data(
 
     print(f"Downloading {quarter} data from SEC...")
 
-    with httpx.Client(
-        headers={"User-Agent": config.user_agent},
-        timeout=120.0,
-        follow_redirects=True,
-    ) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        zip_path.write_bytes(response.content)
-
-    print(f"Downloaded {len(response.content) / 1024 / 1024:.1f} MB")
+    # Stream to a partial file and move it into place once complete, so the data
+    # set is never held in memory and an interrupted download isn't taken as cached
+    part_path = zip_path.with_name(f"{zip_path.name}.part")
+    try:
+        with httpx.Client(
+            headers={"User-Agent": config.user_agent},
+            timeout=120.0,
+            follow_redirects=True,
+        ) as client, client.stream("GET", url) as response:
+            response.raise_for_status()
+            with open(part_path, "wb") as f:
+                for chunk in response.iter_bytes(_DOWNLOAD_CHUNK_BYTES):
+                    f.write(chunk)
+        part_path.replace(zip_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    print(f"Downloaded {zip_path.stat().st_size / 1024 / 1024:.1f} MB")
     return zip_path
 
 
@@ -12,6 +12,7 @@ from .stock_storage import (
     save_stock_holdings,
     load_stock_holdings,
     get_stock_quarters,
+    get_all_stock_quarters,
     get_stock_storage_bytes,
     get_total_stock_storage,
     format_bytes,
@@ -30,6 +31,7 @@ __all__ = [
     "save_stock_holdings",
     "load_stock_holdings",
     "get_stock_quarters",
+    "get_all_stock_quarters",
     "get_stock_storage_bytes",
     "get_total_stock_storage",
     "format_bytes",
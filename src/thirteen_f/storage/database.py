@@ -2,13 +2,16 @@
 
 import json
 import sqlite3
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from ..config import Config
 from ..edgar.parser import Holding
 from .models import FilingRecord, FundRecord, HoldingRecord
 
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 3
 
 SCHEMA = """
 -- Schema version tracking
@@ -57,9 +60,15 @@ CREATE TABLE IF NOT EXISTS holdings (
     voting_sole INTEGER,
     voting_shared INTEGER,
     voting_none INTEGER,
+    cluster TEXT,
     UNIQUE(filing_id, cusip, title_of_class, put_call, shares_type)
 );
 
+-- Fingerprint of the clustering rules that assigned holdings.cluster
+CREATE TABLE IF NOT EXISTS cluster_rules (
+    fingerprint TEXT NOT NULL
+);
+
 -- Optional enrichment table
 CREATE TABLE IF NOT EXISTS cusip_enrichment (
     cusip TEXT PRIMARY KEY,
@@ -76,6 +85,23 @@ CREATE INDEX IF NOT EXISTS idx_holdings_filing_id ON holdings(filing_id);
 CREATE INDEX IF NOT EXISTS idx_holdings_cusip ON holdings(cusip);
 """
 
+# Holding columns that can be fetched column-wise, in export order
+HOLDING_COLUMNS = (
+    "issuer_name",
+    "title_of_class",
+    "cusip",
+    "figi",
+    "value_thousands",
+    "value_usd",
+    "shares_or_principal",
+    "shares_type",
+    "put_call",
+    "investment_discretion",
+    "voting_sole",
+    "voting_shared",
+    "voting_none",
+)
+
 
 class Database:
     """SQLite database manager."""
@@ -84,6 +110,7 @@ class Database:
         self.config = config
         self.db_path = config.db_path
         self._conn: sqlite3.Connection | None = None
+        self._in_transaction = False
 
     def connect(self) -> None:
         """Open database connection and ensure schema exists."""
@@ -103,20 +130,49 @@ class Database:
             # Fresh database - create all tables
             cursor.executescript(SCHEMA)
             cursor.execute("INSERT INTO schema_version (version) VALUES (?)", (SCHEMA_VERSION,))
-            self._conn.commit()
-            return
+        else:
+            # Check current version
+            cursor.execute("SELECT MAX(version) FROM schema_version")
+            current_version = cursor.fetchone()[0] or 0
+
+            if current_version < SCHEMA_VERSION:
+                # Run migrations as needed
+                if current_version < 2:
+                    cursor.execute("ALTER TABLE holdings ADD COLUMN cluster TEXT")
+                if current_version < 3:
+                    cursor.execute(
+                        "CREATE TABLE IF NOT EXISTS cluster_rules (fingerprint TEXT NOT NULL)"
+                    )
+                cursor.execute(
+                    "INSERT OR REPLACE INTO schema_version (version) VALUES (?)", (SCHEMA_VERSION,)
+                )
 
-        # Check current version
-        cursor.execute("SELECT MAX(version) FROM schema_version")
-        current_version = cursor.fetchone()[0] or 0
+        self._refresh_clusters(cursor)
+        self._conn.commit()
 
-        if current_version < SCHEMA_VERSION:
-            # Run migrations as needed
-            # For now, just update version
-            cursor.execute(
-                "INSERT OR REPLACE INTO schema_version (version) VALUES (?)", (SCHEMA_VERSION,)
-            )
-            self._conn.commit()
+    @staticmethod
+    def _refresh_clusters(cursor: sqlite3.Cursor) -> None:
+        """
+        Reassign stored clusters if the clustering rules changed since they were written.
+
+        The fingerprint of the rules is kept next to the rows, so an edited keyword
+        table (or a database migrated from before clusters were stored) backfills
+        every holding with one UPDATE per distinct issuer name.
+        """
+        from ..analysis.clustering import RULES_FINGERPRINT, assign_cluster
+
+        cursor.execute("SELECT fingerprint FROM cluster_rules")
+        row = cursor.fetchone()
+        if row is not None and row[0] == RULES_FINGERPRINT:
+            return
+
+        cursor.execute("SELECT DISTINCT issuer_name FROM holdings")
+        cursor.executemany(
+            "UPDATE holdings SET cluster = ? WHERE issuer_name = ?",
+            [(assign_cluster(name), name) for (name,) in cursor.fetchall()],
+        )
+        cursor.execute("DELETE FROM cluster_rules")
+        cursor.execute("INSERT INTO cluster_rules (fingerprint) VALUES (?)", (RULES_FINGERPRINT,))
 
     @property
     def conn(self) -> sqlite3.Connection:
@@ -137,6 +193,34 @@ class Database:
     def __exit__(self, *args) -> None:
         self.close()
 
+    def _commit(self) -> None:
+        """Commit a write, unless it is part of an open transaction()."""
+        if not self._in_transaction:
+            self.conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group writes into a single commit.
+
+        Writes made inside the block are committed together when it exits, or
+        rolled back if it raises. Nested blocks join the outer transaction.
+        """
+        if self._in_transaction:
+            yield
+            return
+
+        self._in_transaction = True
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._in_transaction = False
+
     # Fund operations
 
     def get_fund_by_name(self, display_name: str) -> FundRecord | None:
@@ -184,7 +268,7 @@ class Database:
             (fund.display_name, fund.cik, json.dumps(fund.tags), fund.created_at),
         )
         result = cursor.fetchone()[0]
-        self.conn.commit()
+        self._commit()
         return result
 
     def get_all_funds(self) -> list[FundRecord]:
@@ -222,7 +306,7 @@ class Database:
         cursor.execute("DELETE FROM filings WHERE fund_id = ?", (fund.id,))
         # Delete fund
         cursor.execute("DELETE FROM funds WHERE id = ?", (fund.id,))
-        self.conn.commit()
+        self._commit()
         return True
 
     # Filing operations
@@ -255,6 +339,19 @@ class Database:
         )
         return cursor.fetchone() is not None
 
+    def get_existing_accessions(self, accession_numbers: list[str]) -> set[str]:
+        """Get the subset of accession numbers that are already stored, in one query."""
+        if not accession_numbers:
+            return set()
+
+        placeholders = ", ".join("?" * len(accession_numbers))
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"SELECT accession_number FROM filings WHERE accession_number IN ({placeholders})",
+            tuple(accession_numbers),
+        )
+        return {row["accession_number"] for row in cursor.fetchall()}
+
     def upsert_filing(self, filing: FilingRecord) -> int:
         """Insert or update a filing, returning its ID."""
         cursor = self.conn.cursor()
@@ -283,7 +380,7 @@ class Database:
             ),
         )
         result = cursor.fetchone()[0]
-        self.conn.commit()
+        self._commit()
         return result
 
     def get_filings_for_fund(
@@ -326,7 +423,14 @@ class Database:
     # Holdings operations
 
     def insert_holdings(self, filing_id: int, holdings: list[Holding]) -> int:
-        """Insert holdings for a filing, returning count inserted."""
+        """
+        Insert holdings for a filing, returning count inserted.
+
+        Each holding's cluster is assigned here, once, so per-cluster totals can be
+        aggregated in SQLite; see _refresh_clusters for how it stays current.
+        """
+        from ..analysis.clustering import assign_cluster
+
         cursor = self.conn.cursor()
         count = 0
         for h in holdings:
@@ -336,9 +440,10 @@ class Database:
                     INSERT INTO holdings (
                         filing_id, issuer_name, title_of_class, cusip, figi,
                         value_thousands, value_usd, shares_or_principal, shares_type,
-                        put_call, investment_discretion, voting_sole, voting_shared, voting_none
+                        put_call, investment_discretion, voting_sole, voting_shared, voting_none,
+                        cluster
                     )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     ON CONFLICT DO NOTHING
                     """,
                     (
@@ -356,15 +461,45 @@ class Database:
                         h.voting_sole,
                         h.voting_shared,
                         h.voting_none,
+                        assign_cluster(h.issuer_name),
                     ),
                 )
                 if cursor.rowcount > 0:
                     count += 1
             except sqlite3.IntegrityError:
                 pass
-        self.conn.commit()
+        self._commit()
         return count
 
+    @staticmethod
+    def _holding_from_row(row: sqlite3.Row) -> HoldingRecord:
+        """
+        Build a HoldingRecord from a holdings row.
+
+        The strings that key holdings across quarters are interned, so the same
+        CUSIP loaded for different filings is one object and dict lookups on
+        diff keys resolve by identity.
+        """
+        put_call = row["put_call"]
+        return HoldingRecord(
+            id=row["id"],
+            filing_id=row["filing_id"],
+            issuer_name=sys.intern(row["issuer_name"]),
+            title_of_class=sys.intern(row["title_of_class"]),
+            cusip=sys.intern(row["cusip"]),
+            figi=row["figi"],
+            value_thousands=row["value_thousands"],
+            value_usd=row["value_usd"],
+            shares_or_principal=row["shares_or_principal"],
+            shares_type=row["shares_type"],
+            put_call=sys.intern(put_call) if put_call else put_call,
+            investment_discretion=row["investment_discretion"],
+            voting_sole=row["voting_sole"],
+            voting_shared=row["voting_shared"],
+            voting_none=row["voting_none"],
+            cluster=row["cluster"],
+        )
+
     def get_holdings_for_filing(self, filing_id: int) -> list[HoldingRecord]:
         """Get all holdings for a filing."""
         cursor = self.conn.cursor()
@@ -372,26 +507,79 @@ class Database:
             "SELECT * FROM holdings WHERE filing_id = ? ORDER BY value_usd DESC",
             (filing_id,),
         )
-        return [
-            HoldingRecord(
-                id=row["id"],
-                filing_id=row["filing_id"],
-                issuer_name=row["issuer_name"],
-                title_of_class=row["title_of_class"],
-                cusip=row["cusip"],
-                figi=row["figi"],
-                value_thousands=row["value_thousands"],
-                value_usd=row["value_usd"],
-                shares_or_principal=row["shares_or_principal"],
-                shares_type=row["shares_type"],
-                put_call=row["put_call"],
-                investment_discretion=row["investment_discretion"],
-                voting_sole=row["voting_sole"],
-                voting_shared=row["voting_shared"],
-                voting_none=row["voting_none"],
-            )
-            for row in cursor.fetchall()
-        ]
+        return [self._holding_from_row(row) for row in cursor.fetchall()]
+
+    def get_holdings_for_filings(self, filing_ids: list[int]) -> dict[int, list[HoldingRecord]]:
+        """
+        Get holdings for several filings in a single query.
+
+        Args:
+            filing_ids: Filing IDs to fetch
+
+        Returns:
+            Dict mapping each filing ID to its holdings, ordered by value descending
+        """
+        holdings: dict[int, list[HoldingRecord]] = {filing_id: [] for filing_id in filing_ids}
+        if not filing_ids:
+            return holdings
+
+        placeholders = ", ".join("?" * len(filing_ids))
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"SELECT * FROM holdings WHERE filing_id IN ({placeholders}) "
+            "ORDER BY filing_id, value_usd DESC",
+            tuple(filing_ids),
+        )
+        for row in cursor.fetchall():
+            holdings[row["filing_id"]].append(self._holding_from_row(row))
+        return holdings
+
+    def get_cluster_values_for_filing(self, filing_id: int) -> dict[str, int]:
+        """
+        Get total holding value per cluster for a filing, aggregated in SQLite.
+
+        Args:
+            filing_id: Filing ID
+
+        Returns:
+            Dict mapping cluster name to total value in USD
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT cluster, SUM(value_usd) FROM holdings WHERE filing_id = ? GROUP BY cluster",
+            (filing_id,),
+        )
+        return dict(cursor.fetchall())
+
+    def get_holdings_columns_for_filing(
+        self, filing_id: int, columns: tuple[str, ...] = HOLDING_COLUMNS
+    ) -> dict[str, list]:
+        """
+        Get holdings for a filing as a column name -> values mapping.
+
+        Rows are ordered by value descending, as in get_holdings_for_filing.
+
+        Args:
+            filing_id: Filing ID
+            columns: Columns to fetch (must be in HOLDING_COLUMNS)
+
+        Returns:
+            Dict mapping each requested column to a list of values
+        """
+        unknown = set(columns) - set(HOLDING_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown holding columns: {sorted(unknown)}")
+
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"SELECT {', '.join(columns)} FROM holdings WHERE filing_id = ? "
+            "ORDER BY value_usd DESC",
+            (filing_id,),
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return {name: [] for name in columns}
+        return dict(zip(columns, map(list, zip(*rows))))
 
     # Query helpers
 
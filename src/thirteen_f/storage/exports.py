@@ -10,30 +10,11 @@ from .models import FilingRecord
 
 def holdings_to_dataframe(db: Database, filing_id: int) -> pd.DataFrame:
     """Convert holdings for a filing to a DataFrame."""
-    holdings = db.get_holdings_for_filing(filing_id)
-    if not holdings:
+    columns = db.get_holdings_columns_for_filing(filing_id)
+    if not columns["cusip"]:
         return pd.DataFrame()
 
-    return pd.DataFrame(
-        [
-            {
-                "issuer_name": h.issuer_name,
-                "title_of_class": h.title_of_class,
-                "cusip": h.cusip,
-                "figi": h.figi,
-                "value_thousands": h.value_thousands,
-                "value_usd": h.value_usd,
-                "shares_or_principal": h.shares_or_principal,
-                "shares_type": h.shares_type,
-                "put_call": h.put_call,
-                "investment_discretion": h.investment_discretion,
-                "voting_sole": h.voting_sole,
-                "voting_shared": h.voting_shared,
-                "voting_none": h.voting_none,
-            }
-            for h in holdings
-        ]
-    )
+    return pd.DataFrame(columns)
 
 
 def export_to_csv(db: Database, filing: FilingRecord, output_path: Path) -> Path:
@@ -1,7 +1,7 @@
 """Data models for storage."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 @dataclass
@@ -12,7 +12,7 @@ class FundRecord:
     display_name: str
     cik: str
     tags: list[str] = field(default_factory=list)
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 
 @dataclass
@@ -28,7 +28,7 @@ class FilingRecord:
     is_amendment: bool
     total_value_usd: int
     position_count: int
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 
 @dataclass
@@ -50,3 +50,4 @@ class HoldingRecord:
     voting_sole: int
     voting_shared: int
     voting_none: int
+    cluster: str | None = None
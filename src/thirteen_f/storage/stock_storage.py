@@ -1,10 +1,11 @@
 """Stock holdings storage management."""
 
 import json
+import os
 import re
 import shutil
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
@@ -12,6 +13,9 @@ import yaml
 from ..config import Config
 from ..sec.quarterly_data import HoldingRecord
 
+# Filer CIKs in each stored holdings file, with the (mtime_ns, size) they were read at
+_HOLDER_CIKS_CACHE: dict[Path, tuple[tuple[int, int], frozenset[str]]] = {}
+
 
 def _validate_path_component(value: str, name: str) -> str:
     """Validate a value is safe to use as a path component.
@@ -154,7 +158,7 @@ def add_tracked_stock(
         ticker=safe_ticker,
         cusip=cusip,
         name=name,
-        added_at=datetime.utcnow().isoformat(),
+        added_at=datetime.now(timezone.utc).isoformat(),
         quarters_stored=0,
         total_holders=0,
     )
@@ -193,6 +197,10 @@ def remove_tracked_stock(ticker: str, config: Config) -> int:
         bytes_freed = sum(f.stat().st_size for f in stock_dir.rglob("*") if f.is_file())
         shutil.rmtree(stock_dir)
 
+    # Drop the holder CIKs cached for its deleted files
+    for path in [path for path in _HOLDER_CIKS_CACHE if path.parent == stock_dir]:
+        del _HOLDER_CIKS_CACHE[path]
+
     return bytes_freed
 
 
@@ -223,7 +231,7 @@ def save_stock_holdings(
     data = {
         "ticker": ticker.upper(),
         "quarter": quarter,
-        "saved_at": datetime.utcnow().isoformat(),
+        "saved_at": datetime.now(timezone.utc).isoformat(),
         "holder_count": len(holdings),
         "holdings": [asdict(h) for h in holdings],
     }
@@ -293,6 +301,41 @@ def get_stock_quarters(ticker: str, config: Config) -> list[str]:
     return sorted(quarters, reverse=True)
 
 
+def get_all_stock_quarters(config: Config) -> dict[str, set[str]]:
+    """Get the quarters that have data for every stored stock.
+
+    One scan of the stock data directory, for callers that would otherwise
+    call get_stock_quarters once per stock. Directories and files whose names
+    are not valid tickers or quarters are skipped.
+
+    Returns:
+        Dict mapping each stored ticker to its set of quarters
+    """
+    stored = {}
+    with os.scandir(get_stock_data_dir(config)) as stock_dirs:
+        for stock_dir in stock_dirs:
+            if not stock_dir.is_dir():
+                continue
+            try:
+                ticker = _validate_path_component(stock_dir.name, "ticker")
+            except ValueError:
+                continue
+
+            quarters = set()
+            with os.scandir(stock_dir.path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        quarters.add(
+                            _validate_path_component(entry.name[: -len(".json")], "quarter")
+                        )
+                    except ValueError:
+                        continue
+            stored[ticker] = quarters
+    return stored
+
+
 def get_stock_storage_bytes(ticker: str, config: Config) -> int:
     """Get total storage used by a stock in bytes."""
     # Validate ticker for safe path usage
@@ -326,6 +369,25 @@ def get_total_stock_storage(config: Config) -> dict:
     }
 
 
+def _load_holder_ciks(path: Path) -> frozenset[str]:
+    """Get the filer CIKs in a stored holdings file.
+
+    Re-read only when the file has changed, since every save recounts the
+    holders of all of a stock's quarters.
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _HOLDER_CIKS_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(path) as f:
+        data = json.load(f)
+    ciks = frozenset(h["filer_cik"] for h in data["holdings"])
+    _HOLDER_CIKS_CACHE[path] = (stamp, ciks)
+    return ciks
+
+
 def _update_stock_metadata(ticker: str, config: Config) -> None:
     """Update metadata for a tracked stock after data changes."""
     stocks = load_tracked_stocks(config)
@@ -339,10 +401,9 @@ def _update_stock_metadata(ticker: str, config: Config) -> None:
             # Count unique holders across all quarters
             all_holders = set()
             for quarter in quarters:
-                holdings = load_stock_holdings(ticker, quarter, config)
-                if holdings:
-                    for h in holdings:
-                        all_holders.add(h.filer_cik)
+                all_holders.update(
+                    _load_holder_ciks(get_stock_holdings_path(ticker, quarter, config))
+                )
             stock.total_holders = len(all_holders)
             break
 
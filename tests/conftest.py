@@ -0,0 +1,60 @@
+"""Shared fixtures and helpers for tests that store filings."""
+
+import pytest
+
+from thirteen_f.config import Config
+from thirteen_f.edgar.parser import Holding
+from thirteen_f.storage.database import Database
+from thirteen_f.storage.models import FilingRecord, FundRecord
+
+
+def make_holding(cusip: str, name: str, value_usd: int, put_call: str | None = None) -> Holding:
+    return Holding(
+        issuer_name=name,
+        title_of_class="COM",
+        cusip=cusip,
+        figi=None,
+        value_thousands=value_usd // 1000,
+        value_usd=value_usd,
+        shares_or_principal=value_usd // 100,
+        shares_type="SH",
+        put_call=put_call,
+        investment_discretion="SOLE",
+        voting_sole=0,
+        voting_shared=0,
+        voting_none=0,
+    )
+
+
+def add_filing(db: Database, fund_id: int, period: str, holdings: list[Holding]) -> FilingRecord:
+    """Store a 13F-HR filing for ``period`` with the given holdings."""
+    filing = FilingRecord(
+        id=None,
+        fund_id=fund_id,
+        accession_number=f"0000000000-00-{period}",
+        form_type="13F-HR",
+        filing_date=period,
+        period_of_report=period,
+        is_amendment=False,
+        total_value_usd=sum(h.value_usd for h in holdings),
+        position_count=len(holdings),
+    )
+    filing.id = db.upsert_filing(filing)
+    db.insert_holdings(filing.id, holdings)
+    return filing
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(base_dir=tmp_path, user_agent="test test@example.com")
+
+
+@pytest.fixture
+def db(config):
+    with Database(config) as database:
+        yield database
+
+
+@pytest.fixture
+def fund_id(db):
+    return db.upsert_fund(FundRecord(id=None, display_name="Test Fund", cik="0000000001"))
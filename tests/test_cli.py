@@ -0,0 +1,296 @@
+"""Tests for CLI helpers."""
+
+import subprocess
+import sys
+import threading
+import time
+from datetime import date
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from thirteen_f.cli import (
+    _download_stock_quarters,
+    _filing_calendar,
+    _get_funds,
+    _home_prefix,
+    _send_notification,
+    _thread_pool,
+    add_fund,
+    cli,
+    escape_applescript_string,
+    sanitize_fund_name,
+    sanitize_tag,
+    validate_output_path,
+)
+from thirteen_f.config import Config, Fund, load_funds, save_funds
+from thirteen_f.edgar.submissions import FilingInfo
+from thirteen_f.storage.database import Database
+
+from .conftest import make_holding
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    home = tmp_path / "home"
+    cwd = tmp_path / "cwd"
+    home.mkdir()
+    cwd.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(cwd)
+    _home_prefix.cache_clear()
+    yield Config(base_dir=tmp_path / "project", user_agent="test test@example.com")
+    _home_prefix.cache_clear()
+
+
+class TestValidateOutputPath:
+    def test_allowed_bases(self, config, tmp_path):
+        for output in [
+            config.base_dir,
+            config.base_dir / "out.csv",
+            config.artifacts_dir / "exports" / "out.csv",
+            tmp_path / "cwd" / "out.csv",
+            tmp_path / "home" / "out.csv",
+            "relative.csv",
+        ]:
+            assert validate_output_path(str(output), config).is_absolute()
+
+    def test_outside_bases(self, config, tmp_path):
+        for output in [
+            tmp_path / "elsewhere.csv",
+            tmp_path / "cwd" / ".." / "escape.csv",
+            tmp_path / "project-evil" / "out.csv",  # shares a string prefix with base_dir
+        ]:
+            with pytest.raises(click.ClickException, match="Output path must be within"):
+                validate_output_path(str(output), config)
+
+
+class TestSanitizeFundName:
+    def test_valid(self):
+        assert sanitize_fund_name("Berkshire Hathaway ") == "Berkshire Hathaway"
+
+    def test_length(self):
+        for name in ["", "x" * 256]:
+            with pytest.raises(click.ClickException, match="1-255 characters"):
+                sanitize_fund_name(name)
+
+    def test_invalid_characters(self):
+        for char in [":", "\n", "\r", "\t", "\x00"]:
+            with pytest.raises(click.ClickException, match="invalid character"):
+                sanitize_fund_name(f"Fund{char}Name")
+
+
+class TestEscapeAppleScriptString:
+    def test_plain(self):
+        assert escape_applescript_string("3 new filings") == "3 new filings"
+
+    def test_quotes_and_backslashes(self):
+        assert escape_applescript_string('say "hi" \\ bye') == (
+            'say " & quote & "hi" & quote & " \\\\ bye'
+        )
+
+    def test_control_characters(self):
+        assert escape_applescript_string("a\nb\rc\td\x00e") == "a b c de"
+
+
+class TestSanitizeTag:
+    def test_valid(self):
+        assert sanitize_tag("tech") == "tech"
+        assert sanitize_tag("long_short-2") == "long_short-2"
+
+    def test_strips_whitespace(self):
+        assert sanitize_tag("  tech \n") == "tech"
+
+    def test_empty(self):
+        assert sanitize_tag("   ") == ""
+
+    def test_invalid_characters(self):
+        for tag in ["a b", "a\nb", "a;b", "a/b"]:
+            with pytest.raises(click.ClickException):
+                sanitize_tag(tag)
+
+    def test_too_long(self):
+        with pytest.raises(click.ClickException):
+            sanitize_tag("x" * 51)
+
+
+class TestFilingCalendar:
+    def test_deadlines(self):
+        calendar = _filing_calendar(2025)
+        assert [(quarter, deadline) for quarter, _, deadline in calendar] == [
+            ("Q4 2024", date(2025, 2, 14)),
+            ("Q1 2025", date(2025, 5, 15)),
+            ("Q2 2025", date(2025, 8, 14)),
+            ("Q3 2025", date(2025, 11, 14)),
+            ("Q4 2025", date(2026, 2, 14)),
+        ]
+
+    def test_filing_window_length(self):
+        _, period_end, deadline = _filing_calendar(2025)[1]
+        assert (deadline - period_end).days == 45
+
+
+class TestSendNotification:
+    def test_reaps_notifier_process(self, monkeypatch):
+        started = []
+        real_popen = subprocess.Popen
+
+        def popen(args, **kwargs):
+            assert args[0] == "osascript"
+            started.append(real_popen([sys.executable, "-c", ""], **kwargs))
+            return started[-1]
+
+        monkeypatch.setattr(subprocess, "Popen", popen)
+        _send_notification("13F Check", "No new filings available.")
+
+        # Nothing waits on the process here; it is reaped in the background
+        [process] = started
+        deadline = time.monotonic() + 10
+        while process.returncode is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert process.returncode == 0
+
+
+class TestThreadPool:
+    def test_interrupt_cancels_queued_work(self):
+        release = threading.Event()
+        with pytest.raises(KeyboardInterrupt):
+            with _thread_pool(1) as pool:
+                running = pool.submit(release.wait)
+                queued = pool.submit(lambda: None)
+                raise KeyboardInterrupt
+
+        assert queued.cancelled()
+        release.set()
+        assert running.result(timeout=5)
+
+    def test_waits_for_work_on_normal_exit(self):
+        with _thread_pool(1) as pool:
+            futures = [pool.submit(lambda i=i: i) for i in range(3)]
+        assert [f.result(timeout=0) for f in futures] == [0, 1, 2]
+
+
+class TestDownloadStockQuarters:
+    def test_saves_each_quarter_in_order(self, config, monkeypatch, capsys):
+        downloaded, saved = [], []
+
+        def download(quarter, config):
+            if quarter == "2024Q4":
+                raise RuntimeError("unavailable")
+            downloaded.append(quarter)
+
+        monkeypatch.setattr("thirteen_f.sec.quarterly_data.download_quarterly_data", download)
+        monkeypatch.setattr(
+            "thirteen_f.sec.quarterly_data.extract_cusip_holdings",
+            lambda quarter, cusip, config, min_value: [quarter] * int(quarter[-1]),
+        )
+        monkeypatch.setattr(
+            "thirteen_f.storage.stock_storage.save_stock_holdings",
+            lambda ticker, quarter, holdings, config: saved.append((ticker, quarter)),
+        )
+
+        _download_stock_quarters("NVDA", "67066G104", ["2025Q2", "2025Q1", "2024Q4"], config)
+
+        assert sorted(downloaded) == ["2025Q1", "2025Q2"]
+        assert saved == [("NVDA", "2025Q2"), ("NVDA", "2025Q1")]
+        assert capsys.readouterr().out.splitlines() == [
+            "  2025Q2... 2 holders",
+            "  2025Q1... 1 holders",
+            "  2024Q4... Error: unavailable",
+        ]
+
+
+class TestPull:
+    ACCESSION = "0000950123-25-000001"
+
+    def test_failed_export_keeps_filing(self, config, monkeypatch):
+        save_funds(config, [Fund(display_name="Tiger Global", cik="0001167483")])
+        filing = FilingInfo(self.ACCESSION, "13F-HR", "2025-05-15", "2025-03-31", False, "x.xml")
+        monkeypatch.setattr(
+            "thirteen_f.edgar.submissions.get_13f_filings", lambda *args, **kwargs: [filing]
+        )
+        monkeypatch.setattr(
+            "thirteen_f.cli._fetch_info_table",
+            lambda client, cik, accession: ([make_holding("67066G104", "NVIDIA CORP", 300)], None),
+        )
+
+        def export_fails(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("thirteen_f.storage.exports.export_to_csv", export_fails)
+
+        result = CliRunner().invoke(cli, ["pull", "--fund", "Tiger Global"], obj={"config": config})
+        assert isinstance(result.exception, OSError)
+        with Database(config) as db:
+            assert db.filing_exists(self.ACCESSION)
+
+
+class TestFundCommands:
+    @pytest.fixture(autouse=True)
+    def _funds(self, config):
+        save_funds(config, [Fund(display_name="Tiger Global", cik="0001167483", tags=["tech"])])
+
+    def _invoke(self, config, *args):
+        return CliRunner().invoke(cli, list(args), obj={"config": config})
+
+    def test_add_fund(self, config):
+        result = self._invoke(config, "add-fund", "--name", "Coatue", "--cik", "1135730")
+        assert result.exit_code == 0
+        assert "Added fund: Coatue (CIK: 0001135730)" in result.output
+        assert [f.display_name for f in load_funds(config)] == ["Tiger Global", "Coatue"]
+
+    def test_add_fund_dedupes_tags(self, config):
+        self._invoke(config, "add-fund", "--name", "Coatue", "--cik", "1", "--tags", "a, b,,a,c")
+        assert load_funds(config)[-1].tags == ["a", "b", "c"]
+
+    def test_add_existing_fund_is_case_insensitive(self, config):
+        result = self._invoke(config, "add-fund", "--name", "tiger GLOBAL", "--cik", "1")
+        assert "already exists" in result.output
+        assert len(load_funds(config)) == 1
+
+    def test_list_funds(self, config):
+        for _ in range(2):
+            result = self._invoke(config, "list-funds")
+            assert result.exit_code == 0
+            assert "Tiger Global" in result.output
+
+    def test_remove_fund(self, config):
+        result = self._invoke(config, "remove-fund", "--name", "TIGER global")
+        assert result.exit_code == 0
+        assert load_funds(config) == []
+
+    def test_remove_missing_fund(self, config):
+        result = self._invoke(config, "remove-fund", "--name", "Nobody")
+        assert "not found" in result.output
+        assert len(load_funds(config)) == 1
+
+    def test_check_new(self, config, monkeypatch):
+        monkeypatch.setattr(
+            "thirteen_f.edgar.submissions.get_latest_filing_period",
+            lambda client, cik: "2025-06-30",
+        )
+        result = self._invoke(config, "check-new")
+        assert result.exit_code == 0
+        assert "1 fund(s) have new filings available." in result.output
+
+    def test_funds_loaded_once_per_context(self, config):
+        ctx = click.Context(cli, obj={"config": config})
+        funds = _get_funds(ctx)
+        save_funds(config, [])
+        assert _get_funds(ctx) is funds
+
+    def test_add_then_list_in_one_context(self, config):
+        ctx = click.Context(cli, obj={"config": config})
+        _get_funds(ctx)
+        ctx.invoke(add_fund, name="Coatue", cik="1135730", tags="")
+        assert [f.display_name for f in _get_funds(ctx)] == ["Tiger Global", "Coatue"]
+
+
+class TestStartup:
+    def test_import_skips_heavy_modules(self):
+        code = "import sys, thirteen_f.cli; print(sorted({'httpx', 'pandas'} & set(sys.modules)))"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
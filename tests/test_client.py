@@ -0,0 +1,153 @@
+"""Tests for the EDGAR HTTP client."""
+
+import threading
+
+import httpx
+import pytest
+
+from thirteen_f.config import Config
+from thirteen_f.edgar import client as client_module
+from thirteen_f.edgar.client import EdgarClient
+
+
+@pytest.fixture
+def client(tmp_path):
+    config = Config(base_dir=tmp_path, user_agent="test test@example.com")
+    with EdgarClient(config) as edgar_client:
+        yield edgar_client
+
+
+class TestRateLimit:
+    def test_threads_get_distinct_slots(self, client, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(client_module.time, "monotonic_ns", lambda: 1_000_000_000_000)
+        monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+
+        threads = [threading.Thread(target=client._rate_limit) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # The first request goes immediately; the rest queue one interval apart
+        assert sorted(sleeps) == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+
+class TestCache:
+    URL = "https://www.sec.gov/Archives/edgar/data/1067983/index.json"
+
+    def test_round_trip(self, client):
+        assert client._read_cache(self.URL) is None
+        client._write_cache(self.URL, b"{}")
+        assert client._read_cache(self.URL) == b"{}"
+        assert client._get_cache_path(self.URL).name == f"{client._cache_key(self.URL)}.json"
+
+    def test_migrates_legacy_entry(self, client):
+        legacy_path = client.cache_dir / f"{client._legacy_cache_key(self.URL)}.json"
+        legacy_path.write_bytes(b"old")
+
+        assert client._read_cache(self.URL) == b"old"
+        assert not legacy_path.exists()
+        assert client._get_cache_path(self.URL).read_bytes() == b"old"
+
+    def test_large_entries_compressed(self, client):
+        data = b"<infoTable>" * 1000
+        client._write_cache(self.URL, data, ".xml")
+
+        cache_path = client._get_cache_path(self.URL, ".xml")
+        compressed_path = client._compressed_path(cache_path)
+        assert not cache_path.exists()
+        assert compressed_path.stat().st_size < len(data) // 10
+        assert client._read_cache(self.URL, ".xml") == data
+
+        # Rewriting a small response replaces the compressed copy
+        client._write_cache(self.URL, b"<a/>", ".xml")
+        assert not compressed_path.exists()
+        assert client._read_cache(self.URL, ".xml") == b"<a/>"
+
+
+class TestMemo:
+    def test_repeat_get_skips_disk(self, client):
+        url = TestCache.URL
+        client._write_cache(url, b"{}")
+        assert client.get(url) == b"{}"
+
+        client._get_cache_path(url).unlink()
+        assert client.get(url) == b"{}"
+
+    def test_evicts_least_recently_used(self, client, monkeypatch):
+        monkeypatch.setattr(client_module, "_MEMO_MAX_BYTES", 10)
+        client._memo_put("a", b"aaaa")
+        client._memo_put("b", b"bbbb")
+        client._memo_get("a")
+        client._memo_put("c", b"cccc")
+
+        assert list(client._memo) == ["a", "c"]
+        assert client._memo_bytes == 8
+
+
+class TestRevalidate:
+    URL = "https://data.sec.gov/submissions/CIK0001067983.json"
+
+    @pytest.fixture(autouse=True)
+    def _always_revalidate(self, monkeypatch):
+        monkeypatch.setattr(client_module, "_REVALIDATE_MAX_AGE_SECONDS", 0.0)
+        monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+
+    def _serve(self, client, body):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"' and body == b"v1":
+                return httpx.Response(304)
+            return httpx.Response(200, content=body, headers={"ETag": f'"{body.decode()}"'})
+
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return requests
+
+    def test_not_modified_returns_cached(self, client):
+        requests = self._serve(client, b"v1")
+        assert client.get(self.URL, revalidate=True) == b"v1"
+        assert client.get(self.URL, revalidate=True) == b"v1"
+        assert requests[1].headers["if-none-match"] == '"v1"'
+
+        # Without revalidation the cached copy is used as-is
+        client.get(self.URL)
+        assert len(requests) == 2
+
+    def test_changed_response_replaces_cache(self, client):
+        self._serve(client, b"v1")
+        client.get(self.URL, revalidate=True)
+
+        self._serve(client, b"v2")
+        assert client.get(self.URL, revalidate=True) == b"v2"
+        assert client._read_cache(self.URL) == b"v2"
+        assert client._read_cache_meta(self.URL)["etag"] == '"v2"'
+
+    def test_recently_checked_not_requested(self, client, monkeypatch):
+        requests = self._serve(client, b"v1")
+        client.get(self.URL, revalidate=True)
+
+        monkeypatch.setattr(client_module, "_REVALIDATE_MAX_AGE_SECONDS", 60.0)
+        assert client.get(self.URL, revalidate=True) == b"v1"
+        assert len(requests) == 1
+
+    def test_entry_without_sidecar_refetched(self, client, monkeypatch):
+        # A submissions entry cached before validators were kept has no sidecar
+        client._write_cache(self.URL, b"v0")
+        requests = self._serve(client, b"v1")
+
+        monkeypatch.setattr(client_module, "_REVALIDATE_MAX_AGE_SECONDS", 60.0)
+        assert client.get(self.URL, revalidate=True) == b"v1"
+        assert len(requests) == 1
+        assert "if-none-match" not in requests[0].headers
+        assert client._read_cache_meta(self.URL)["etag"] == '"v1"'
+
+    def test_immutable_responses_keep_no_validators(self, client):
+        self._serve(client, b"v1")
+        client.get(TestCache.URL)
+
+        cache_path = client._get_cache_path(TestCache.URL)
+        assert cache_path.exists()
+        assert not client._meta_path(cache_path).exists()
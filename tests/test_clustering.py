@@ -33,6 +33,28 @@ class TestAssignCluster:
         assert assign_cluster("RANDOM UNKNOWN COMPANY") == "Other"
         assert assign_cluster("XYZ HOLDINGS LLC") == "Other"
 
+    def test_case_insensitive(self):
+        assert assign_cluster("Nvidia Corp") == "AI/Semiconductors"
+
+    def test_short_names(self):
+        # Names shorter than every keyword skip the scan; short keywords still match
+        assert assign_cluster("AMD") == "AI/Semiconductors"
+        assert assign_cluster("X") == "Other"
+        assert assign_cluster("") == "Other"
+
+    def test_precedence_follows_cluster_order(self):
+        # "VISA" (Fintech) is defined before "AMAZON" (E-commerce), so it wins even
+        # though it appears later in the name
+        assert assign_cluster("AMAZON VISA JV") == "Fintech/Payments"
+
+    def test_memoized(self):
+        assign_cluster.cache_clear()
+        assert assign_cluster("SNOWFLAKE INC") == "Cloud/SaaS"
+        assert assign_cluster("SNOWFLAKE INC") == "Cloud/SaaS"
+        info = assign_cluster.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
 
 class TestClusterHoldings:
     def test_cluster_multiple_holdings(self):
@@ -0,0 +1,44 @@
+"""Tests for configuration helpers."""
+
+from pathlib import Path
+
+from thirteen_f.config import Config, Fund, index_funds, load_funds, save_funds
+
+
+class TestIndexFunds:
+    def test_case_insensitive_keys(self):
+        fund = Fund(display_name="Tiger Global", cik="0001167483")
+        assert index_funds([fund]) == {"tiger global": fund}
+
+    def test_first_duplicate_wins(self):
+        first = Fund(display_name="Tiger Global", cik="0001167483")
+        second = Fund(display_name="TIGER GLOBAL", cik="0000000001")
+        assert index_funds([first, second])["tiger global"] is first
+
+
+class TestLoadFunds:
+    def test_reloads_after_change(self, tmp_path):
+        config = Config(base_dir=tmp_path, user_agent="test test@example.com")
+        save_funds(config, [Fund(display_name="Tiger Global", cik="0001167483", tags=["tech"])])
+
+        funds = load_funds(config)
+        funds[0].tags.append("mutated")
+        assert load_funds(config)[0].tags == ["tech"]
+
+        # An edit made outside save_funds is picked up too
+        config.funds_file.write_text(config.funds_file.read_text().replace("Tiger", "Tigress"))
+        assert [f.display_name for f in load_funds(config)] == ["Tigress Global"]
+
+        save_funds(config, [])
+        assert load_funds(config) == []
+
+
+class TestConfig:
+    def test_resolved_dirs(self, tmp_path, monkeypatch):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        monkeypatch.chdir(tmp_path)
+
+        config = Config(base_dir=Path("link"), user_agent="test test@example.com")
+        assert config.base_dir_resolved == (tmp_path / "real").resolve()
+        assert config.artifacts_dir_resolved == (tmp_path / "real" / "artifacts").resolve()
@@ -0,0 +1,104 @@
+"""Tests for the SQLite database."""
+
+import sqlite3
+
+import pytest
+
+from thirteen_f.storage.database import SCHEMA, Database
+
+from .conftest import add_filing, make_holding
+
+PERIOD = "2025-03-31"
+ACCESSION = f"0000000000-00-{PERIOD}"
+
+
+class TestHoldingClusters:
+    def test_cluster_assigned_at_insert(self, db, fund_id):
+        filing = add_filing(
+            db,
+            fund_id,
+            PERIOD,
+            [
+                make_holding("67066G104", "NVIDIA CORP", 300),
+                make_holding("007903107", "ADVANCED MICRO DEVICES INC", 200),
+                make_holding("999999999", "RANDOM UNKNOWN COMPANY", 100),
+            ],
+        )
+
+        holdings = db.get_holdings_for_filing(filing.id)
+        assert [h.cluster for h in holdings] == [
+            "AI/Semiconductors",
+            "AI/Semiconductors",
+            "Other",
+        ]
+        assert db.get_cluster_values_for_filing(filing.id) == {
+            "AI/Semiconductors": 500,
+            "Other": 100,
+        }
+
+    def test_migration_backfills_clusters(self, config):
+        # Build a version 1 database, before holdings had a cluster column
+        conn = sqlite3.connect(config.db_path)
+        conn.executescript(SCHEMA.replace("    cluster TEXT,\n", ""))
+        conn.execute("INSERT INTO schema_version (version) VALUES (1)")
+        conn.execute(
+            "INSERT INTO funds (display_name, cik, created_at) VALUES ('Old Fund', '1', '')"
+        )
+        conn.execute(
+            "INSERT INTO filings (fund_id, accession_number, form_type, filing_date, "
+            "period_of_report, is_amendment, created_at) "
+            "VALUES (1, 'a', '13F-HR', '2025-05-15', '2025-03-31', 0, '')"
+        )
+        conn.execute(
+            "INSERT INTO holdings (filing_id, issuer_name, title_of_class, cusip, "
+            "value_thousands, value_usd, shares_or_principal, shares_type) "
+            "VALUES (1, 'VISA INC', 'COM', '92826C839', 1, 1000, 10, 'SH')"
+        )
+        conn.commit()
+        conn.close()
+
+        with Database(config) as db:
+            [holding] = db.get_holdings_for_filing(1)
+            assert holding.cluster == "Fintech/Payments"
+
+    def test_rules_change_reassigns_clusters(self, config, db, fund_id):
+        filing = add_filing(db, fund_id, PERIOD, [make_holding("67066G104", "NVIDIA CORP", 300)])
+        # Simulate clusters written under an older keyword table
+        db.conn.execute("UPDATE holdings SET cluster = 'Retired Cluster'")
+        db.conn.execute("UPDATE cluster_rules SET fingerprint = 'stale'")
+        db.conn.commit()
+
+        with Database(config) as reopened:
+            [holding] = reopened.get_holdings_for_filing(filing.id)
+            assert holding.cluster == "AI/Semiconductors"
+            assert reopened.get_cluster_values_for_filing(filing.id) == {"AI/Semiconductors": 300}
+
+
+class TestTransaction:
+    def test_commits_once_at_exit(self, config, db, fund_id):
+        with db.transaction():
+            filing = add_filing(
+                db, fund_id, PERIOD, [make_holding("67066G104", "NVIDIA CORP", 300)]
+            )
+            with sqlite3.connect(config.db_path) as other:
+                assert other.execute("SELECT COUNT(*) FROM filings").fetchone()[0] == 0
+
+        with sqlite3.connect(config.db_path) as other:
+            assert other.execute("SELECT COUNT(*) FROM filings").fetchone()[0] == 1
+        assert len(db.get_holdings_for_filing(filing.id)) == 1
+
+    def test_rolls_back_on_error(self, db, fund_id):
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                add_filing(db, fund_id, PERIOD, [make_holding("67066G104", "NVIDIA CORP", 300)])
+                raise RuntimeError("export failed")
+
+        assert db.get_filings_for_fund(fund_id) == []
+        assert not db.filing_exists(ACCESSION)
+
+
+class TestGetExistingAccessions:
+    def test_returns_stored_subset(self, db, fund_id):
+        assert db.get_existing_accessions([]) == set()
+        add_filing(db, fund_id, PERIOD, [make_holding("67066G104", "NVIDIA CORP", 300)])
+        assert db.get_existing_accessions([ACCESSION, "0000000000-00-2025-06-30"]) == {ACCESSION}
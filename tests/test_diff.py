@@ -1,8 +1,12 @@
 """Tests for diff engine."""
 
+from dataclasses import fields
+
 import pytest
 
-from thirteen_f.analysis.diff import PositionDiff
+from thirteen_f.analysis.diff import PositionDiff, compute_all_diffs, compute_quarter_diff
+
+from .conftest import add_filing, make_holding
 
 
 class TestPositionDiff:
@@ -113,3 +117,116 @@ class TestPositionDiff:
         assert d["cusip"] == "67066G104"
         assert d["growth_rate"] == 1.0
         assert d["change_type"] == "INCREASE"
+        assert list(d) == [f.name for f in fields(PositionDiff)]
+
+
+class TestComputeQuarterDiff:
+    def test_classification_and_diagnostics(self, db, config, fund_id):
+        prev = add_filing(
+            db,
+            fund_id,
+            "2025-03-31",
+            [
+                make_holding("AAAAAAAAA", "NVIDIA CORP", 60_000_000),
+                make_holding("BBBBBBBBB", "APPLE INC", 30_000_000),
+                make_holding("CCCCCCCCC", "EXITED CO", 10_000_000),
+                make_holding("DDDDDDDDD", "FLAT CO", 10_000_000),
+            ],
+        )
+        now = add_filing(
+            db,
+            fund_id,
+            "2025-06-30",
+            [
+                make_holding("AAAAAAAAA", "NVIDIA CORP", 90_000_000),
+                make_holding("BBBBBBBBB", "APPLE INC", 20_000_000),
+                make_holding("DDDDDDDDD", "FLAT CO", 10_000_000),
+                make_holding("EEEEEEEEE", "NEW STARTER", 2_000_000),
+                make_holding("AAAAAAAAA", "NVIDIA CORP", 5_000_000, put_call="Put"),
+            ],
+        )
+
+        diff = compute_quarter_diff(db, fund_id, "Test Fund", prev, now, config)
+
+        assert diff.total_portfolio_prev == 110_000_000
+        assert diff.total_portfolio_now == 127_000_000
+        assert [p.issuer_name for p in diff.increased] == ["NVIDIA CORP"]
+        assert [p.issuer_name for p in diff.decreased] == ["APPLE INC"]
+        assert [p.issuer_name for p in diff.sold_out] == ["EXITED CO"]
+        assert [p.issuer_name for p in diff.unchanged] == ["FLAT CO"]
+        # The put is keyed separately from the common stock
+        assert sorted((p.issuer_name, p.put_call) for p in diff.new_positions) == [
+            ("NEW STARTER", None),
+            ("NVIDIA CORP", "Put"),
+        ]
+        assert [p.issuer_name for p in diff.new_starters] == ["NEW STARTER"]
+
+        nvda = diff.increased[0]
+        assert nvda.delta_value_usd == 30_000_000
+        assert nvda.growth_rate == pytest.approx(0.5)
+        assert nvda.portfolio_impact == pytest.approx(30 / 110)
+
+        assert [p.delta_value_usd for p in diff.top_adds_by_value] == [
+            30_000_000,
+            5_000_000,
+            2_000_000,
+        ]
+        assert [p.delta_value_usd for p in diff.top_cuts_by_value] == [-10_000_000, -10_000_000]
+        # Exits have no growth rate, so only the trimmed position ranks here
+        assert [p.growth_rate for p in diff.top_cuts_by_growth_rate] == pytest.approx([-1 / 3])
+        assert diff.gross_adds_value == 37_000_000
+        assert diff.gross_cuts_value == 20_000_000
+
+        assert diff.concentration_top5 == pytest.approx(1.0)
+        assert diff.concentration_top10 == pytest.approx(1.0)
+        values = [90, 20, 10, 5, 2]
+        assert diff.herfindahl_index == pytest.approx(sum(v * v for v in values) / 127**2)
+        assert diff.position_count_prev == 4
+        assert diff.position_count_now == 5
+
+
+class TestComputeAllDiffs:
+    def test_matches_pairwise_diffs(self, db, config, fund_id):
+        q1 = add_filing(
+            db, fund_id, "2025-03-31", [make_holding("AAAAAAAAA", "A CORP", 10_000_000)]
+        )
+        q2 = add_filing(
+            db,
+            fund_id,
+            "2025-06-30",
+            [
+                make_holding("AAAAAAAAA", "A CORP", 20_000_000),
+                make_holding("BBBBBBBBB", "B CORP", 1_000),
+            ],
+        )
+        q3 = add_filing(db, fund_id, "2025-09-30", [make_holding("BBBBBBBBB", "B CORP", 5_000)])
+
+        diffs = compute_all_diffs(db, fund_id, "Test Fund", config)
+
+        # Most recent pair first
+        assert [(d.period_from, d.period_to) for d in diffs] == [
+            ("2025-06-30", "2025-09-30"),
+            ("2025-03-31", "2025-06-30"),
+        ]
+        expected = [
+            compute_quarter_diff(db, fund_id, "Test Fund", q2, q3, config),
+            compute_quarter_diff(db, fund_id, "Test Fund", q1, q2, config),
+        ]
+        assert [d.to_dict() for d in diffs] == [d.to_dict() for d in expected]
+
+    def test_process_pool_matches_in_process(self, db, config, fund_id):
+        for i, period in enumerate(["2025-03-31", "2025-06-30", "2025-09-30"]):
+            add_filing(
+                db,
+                fund_id,
+                period,
+                [
+                    make_holding("AAAAAAAAA", "A CORP", 10_000_000 * (i + 1)),
+                    make_holding("BBBBBBBBB", "B CORP", 1_000),
+                ],
+            )
+
+        serial = compute_all_diffs(db, fund_id, "Test Fund", config, max_workers=1)
+        parallel = compute_all_diffs(db, fund_id, "Test Fund", config, max_workers=2)
+
+        assert [d.to_dict() for d in parallel] == [d.to_dict() for d in serial]
@@ -0,0 +1,67 @@
+"""Tests for fund report generation."""
+
+from thirteen_f.edgar.parser import Holding
+from thirteen_f.reports.fund_report import generate_fund_report
+from thirteen_f.storage.database import Database
+
+from .conftest import add_filing, make_holding
+
+
+def _report(db: Database, fund_id: int, quarters: list[list[Holding]]) -> str:
+    """Store one filing per quarter (oldest first) and report on the latest."""
+    for period, holdings in zip(["2025-03-31", "2025-06-30"], quarters):
+        add_filing(db, fund_id, period, holdings)
+    return generate_fund_report(db, fund_id, "Test Fund", db.config)
+
+
+def _section(report: str, heading: str) -> list[str]:
+    lines = report.splitlines()
+    start = lines.index(heading) + 2
+    return lines[start : lines.index("", start)]
+
+
+class TestGenerateFundReport:
+    def test_mid_holdings_grouped_by_cluster(self, db, fund_id):
+        top = [make_holding(f"{i:09d}", f"BIG CO {i}", 1_000_000_000 - i) for i in range(10)]
+        mid = [
+            make_holding("67066G104", "NVIDIA CORP", 50_000_000, "Call"),
+            make_holding("92826C839", "VISA INC", 40_000_000),
+            make_holding("007903107", "ADVANCED MICRO DEVICES INC", 30_000_000),
+        ]
+        report = _report(db, fund_id, [top + mid])
+
+        assert _section(report, "### Holdings #11-30 by Cluster") == [
+            "- **AI/Semiconductors** (2 positions, 0.79%): "
+            "NVIDIA CORP (CALL), ADVANCED MICRO DEVICES INC",
+            "- **Fintech/Payments** (1 positions, 0.40%): VISA INC",
+        ]
+
+    def test_large_cluster_names_truncated(self, db, fund_id):
+        top = [make_holding(f"{i:09d}", f"BIG CO {i}", 1_000_000_000 - i) for i in range(10)]
+        mid = [make_holding(f"{i:09d}", f"SMALL CO {i}", 1_000_000 - i) for i in range(10, 17)]
+        [line] = _section(_report(db, fund_id, [top + mid]), "### Holdings #11-30 by Cluster")
+
+        assert line.endswith(
+            ": SMALL CO 10, SMALL CO 11, SMALL CO 12, SMALL CO 13, SMALL CO 14 +2 more"
+        )
+
+    def test_top_holdings_show_change(self, db, fund_id):
+        prev = [
+            make_holding("67066G104", "NVIDIA CORP", 200_000_000),
+            make_holding("67066G104", "NVIDIA CORP", 50_000_000, "Put"),
+            make_holding("92826C839", "VISA INC", 100_000_000),
+        ]
+        now = [
+            make_holding("67066G104", "NVIDIA CORP", 300_000_000),
+            make_holding("67066G104", "NVIDIA CORP", 50_000_000, "Put"),
+            make_holding("92826C839", "VISA INC", 40_000_000),
+            make_holding("007903107", "ADVANCED MICRO DEVICES INC", 30_000_000),
+        ]
+        rows = _section(_report(db, fund_id, [prev, now]), "### Top 10 Holdings")[2:]
+
+        assert [row.split(" | ")[1] for row in rows] == [
+            "NVIDIA CORP (+$100.0M)",
+            "NVIDIA CORP (PUT)",
+            "VISA INC (-$60.0M)",
+            "ADVANCED MICRO DEVICES INC (+$30.0M)",
+        ]
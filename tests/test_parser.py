@@ -81,6 +81,50 @@ class TestParser:
         assert len(holdings) == 1
         assert holdings[0].put_call == "Put"
 
+    def test_parse_prefixed_namespace(self):
+        xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <ns1:informationTable
+            xmlns:ns1="http://www.sec.gov/edgar/document/thirteenf/informationtable">
+            <ns1:infoTable>
+                <!-- filer comment -->
+                <ns1:nameOfIssuer>MICROSOFT  CORP</ns1:nameOfIssuer>
+                <ns1:titleOfClass>COM</ns1:titleOfClass>
+                <ns1:cusip>594918104</ns1:cusip>
+                <ns1:value>2,500</ns1:value>
+                <ns1:shrsOrPrnAmt>
+                    <ns1:sshPrnamt>7,000</ns1:sshPrnamt>
+                    <ns1:sshPrnamtType>prn</ns1:sshPrnamtType>
+                </ns1:shrsOrPrnAmt>
+                <ns1:putCall>CALL</ns1:putCall>
+                <ns1:investmentDiscretion>dfnd</ns1:investmentDiscretion>
+                <ns1:votingAuthority>
+                    <ns1:Sole>1000</ns1:Sole>
+                    <ns1:Shared>2000</ns1:Shared>
+                    <ns1:None>4000</ns1:None>
+                </ns1:votingAuthority>
+            </ns1:infoTable>
+        </ns1:informationTable>
+        """
+        [h] = parse_13f_info_table(xml)
+        assert h.issuer_name == "MICROSOFT CORP"
+        assert h.value_usd == 2_500_000
+        assert (h.shares_or_principal, h.shares_type) == (7000, "PRN")
+        assert h.put_call == "Call"
+        assert h.investment_discretion == "DFND"
+        assert (h.voting_sole, h.voting_shared, h.voting_none) == (1000, 2000, 4000)
+
+    def test_parse_missing_cusip_skipped(self):
+        xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <informationTable>
+            <infoTable><nameOfIssuer>NO CUSIP</nameOfIssuer><value>1</value></infoTable>
+            <infoTable><cusip>037833100</cusip><sshPrnamt>5</sshPrnamt></infoTable>
+        </informationTable>
+        """
+        [h] = parse_13f_info_table(xml)
+        assert h.cusip == "037833100"
+        assert (h.shares_or_principal, h.shares_type) == (5, "SH")
+        assert h.investment_discretion == "SOLE"
+
     def test_parse_empty_xml(self):
         xml = b"""<?xml version="1.0" encoding="UTF-8"?>
         <informationTable xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable">
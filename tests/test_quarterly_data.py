@@ -0,0 +1,33 @@
+"""Tests for SEC quarterly data set downloads."""
+
+import httpx
+import pytest
+
+from thirteen_f.sec import quarterly_data
+from thirteen_f.sec.quarterly_data import download_quarterly_data
+
+
+def _serve(monkeypatch, handler):
+    real_client = httpx.Client
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(quarterly_data.httpx, "Client", client)
+
+
+class TestDownloadQuarterlyData:
+    def test_streams_to_cache(self, config, monkeypatch):
+        body = b"PK" + bytes(3 * 1024 * 1024)
+        _serve(monkeypatch, lambda request: httpx.Response(200, content=body))
+
+        zip_path = download_quarterly_data("2025Q1", config)
+        assert zip_path.read_bytes() == body
+        assert [p.name for p in zip_path.parent.iterdir()] == [zip_path.name]
+
+    def test_failed_download_leaves_no_file(self, config, monkeypatch):
+        _serve(monkeypatch, lambda request: httpx.Response(404))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            download_quarterly_data("2025Q1", config)
+        assert list((config.cache_dir / "sec_quarterly").iterdir()) == []
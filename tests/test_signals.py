@@ -0,0 +1,147 @@
+"""Tests for signal detection."""
+
+from thirteen_f.analysis.diff import compute_all_diffs
+from thirteen_f.analysis.signals import Strength, detect_signals, detect_starter_to_scale
+from thirteen_f.edgar.parser import Holding
+from thirteen_f.storage.database import Database
+
+from .conftest import add_filing, make_holding
+
+PERIODS = [
+    "2024-03-31",
+    "2024-06-30",
+    "2024-09-30",
+    "2024-12-31",
+    "2025-03-31",
+    "2025-06-30",
+]
+
+
+def _diffs(db: Database, fund_id: int, quarters: list[list[Holding]]) -> list:
+    """Store one filing per quarter (oldest first) and diff them."""
+    for period, holdings in zip(PERIODS, quarters):
+        add_filing(db, fund_id, period, holdings)
+    return compute_all_diffs(db, fund_id, "Test Fund", db.config)
+
+
+def _by_type(signals: list, signal_type: str) -> list:
+    return [s for s in signals if s.signal_type == signal_type]
+
+
+class TestDetectSignals:
+    def test_no_diffs(self):
+        assert detect_signals([]) == []
+
+    def test_consistent_accumulator(self, db, fund_id):
+        base = make_holding("BBBBBBBBB", "BASE CORP", 1_000_000_000)
+        diffs = _diffs(
+            db,
+            fund_id,
+            [
+                [base, make_holding("AAAAAAAAA", "ACCUM CORP", 10_000_000 * (i + 1))]
+                for i in range(5)
+            ],
+        )
+
+        [signal] = _by_type(detect_signals(diffs), "consistent_accumulator")
+        assert signal.holdings == ["ACCUM CORP"]
+        assert signal.quarters == PERIODS[1:5]
+        assert signal.strength is Strength.STRONG
+        assert signal.details == {"consecutive_increases": 4}
+
+    def test_build_then_trim(self, db, fund_id):
+        base = make_holding("BBBBBBBBB", "BASE CORP", 1_000_000_000)
+        values = [10_000_000, 20_000_000, 30_000_000, 15_000_000]
+        diffs = _diffs(
+            db, fund_id, [[base, make_holding("AAAAAAAAA", "TRIM CORP", v)] for v in values]
+        )
+
+        [signal] = _by_type(detect_signals(diffs), "build_then_trim")
+        assert signal.holdings == ["TRIM CORP"]
+        assert signal.quarters == PERIODS[1:4]
+        assert signal.details == {"build_quarters": 2}
+
+    def test_build_then_trim_restarts_after_pause(self, db, fund_id):
+        base = make_holding("BBBBBBBBB", "BASE CORP", 1_000_000_000)
+        # INCREASE, UNCHANGED, INCREASE, INCREASE, DECREASE: the pause resets the build
+        values = [10_000_000, 20_000_000, 20_000_000, 30_000_000, 40_000_000, 35_000_000]
+        diffs = _diffs(
+            db, fund_id, [[base, make_holding("AAAAAAAAA", "TRIM CORP", v)] for v in values]
+        )
+
+        [signal] = _by_type(detect_signals(diffs), "build_then_trim")
+        assert signal.quarters == PERIODS[3:]
+        assert signal.details == {"build_quarters": 2}
+
+    def test_one_quarter_probe(self, db, fund_id):
+        base = make_holding("BBBBBBBBB", "BASE CORP", 1_000_000_000)
+        probe = make_holding("PPPPPPPPP", "PROBE CORP", 1_000_000)
+        diffs = _diffs(db, fund_id, [[base], [base, probe], [base]])
+
+        [signal] = _by_type(detect_signals(diffs), "one_quarter_probe")
+        assert signal.holdings == ["PROBE CORP"]
+        assert signal.quarters == PERIODS[1:3]
+        assert signal.strength is Strength.WEAK
+
+    def test_theme_emergence(self, db, fund_id):
+        base = make_holding("BBBBBBBBB", "BASE CORP", 1_000_000_000)
+        starters = [
+            make_holding("111111111", "NVIDIA CORP", 4_000_000),
+            make_holding("222222222", "BROADCOM INC", 3_000_000),
+            make_holding("333333333", "MICRON TECHNOLOGY INC", 2_000_000),
+            make_holding("444444444", "RANDOM UNKNOWN COMPANY", 1_000_000),
+        ]
+        diffs = _diffs(db, fund_id, [[base], [base, *starters]])
+
+        [signal] = _by_type(detect_signals(diffs), "theme_emergence")
+        assert signal.holdings == ["NVIDIA CORP", "BROADCOM INC", "MICRON TECHNOLOGY INC"]
+        assert signal.quarters == [PERIODS[1]]
+        assert signal.details == {"cluster": "AI/Semiconductors", "count": 3}
+
+    def test_name_from_oldest_trade(self, db, fund_id):
+        base = make_holding("BBBBBBBBB", "BASE CORP", 1_000_000_000)
+        diffs = _diffs(
+            db,
+            fund_id,
+            [
+                [base, make_holding("AAAAAAAAA", "OLD NAME", 10_000_000)],
+                [base, make_holding("AAAAAAAAA", "OLD NAME", 20_000_000)],
+                [base, make_holding("AAAAAAAAA", "NEW NAME", 30_000_000)],
+                [base, make_holding("AAAAAAAAA", "NEW NAME", 40_000_000)],
+            ],
+        )
+
+        [signal] = _by_type(detect_signals(diffs), "consistent_accumulator")
+        assert signal.holdings == ["OLD NAME"]
+
+    def test_sorted_by_strength(self, db, fund_id):
+        base = make_holding("BBBBBBBBB", "BASE CORP", 1_000_000_000)
+        probe = make_holding("PPPPPPPPP", "PROBE CORP", 1_000_000)
+        quarters = [
+            [base, make_holding("AAAAAAAAA", "ACCUM CORP", 10_000_000 * (i + 1))] for i in range(5)
+        ]
+        quarters[1].append(probe)
+
+        strengths = [s.strength for s in detect_signals(_diffs(db, fund_id, quarters))]
+        assert strengths == [Strength.STRONG, Strength.WEAK]
+
+
+class TestDetectStarterToScale:
+    def test_starter_grown_to_size(self, db, fund_id):
+        base = make_holding("BBBBBBBBB", "BASE CORP", 1_000_000_000)
+        diffs = _diffs(
+            db,
+            fund_id,
+            [
+                [base],
+                [base, make_holding("SSSSSSSSS", "STARTER CORP", 1_000_000)],
+                [base, make_holding("SSSSSSSSS", "STARTER CORP", 4_000_000)],
+                [base, make_holding("SSSSSSSSS", "STARTER CORP", 30_000_000)],
+            ],
+        )
+
+        [scaled] = detect_starter_to_scale(diffs)
+        assert scaled["issuer_name"] == "STARTER CORP"
+        assert scaled["start_period"] == PERIODS[1]
+        assert scaled["current_value"] == 30_000_000
+        assert scaled["growth_rate"] == 29.0
@@ -0,0 +1,82 @@
+"""Tests for stock holdings storage."""
+
+from thirteen_f.sec.quarterly_data import HoldingRecord
+from thirteen_f.storage.stock_storage import (
+    _HOLDER_CIKS_CACHE,
+    add_tracked_stock,
+    get_all_stock_quarters,
+    get_stock_data_dir,
+    get_stock_quarters,
+    get_tracked_stock,
+    remove_tracked_stock,
+    save_stock_holdings,
+)
+
+
+def _holding(filer_cik: str) -> HoldingRecord:
+    return HoldingRecord(
+        accession_number=f"{filer_cik}-25-000001",
+        filer_cik=filer_cik,
+        filer_name=f"FUND {filer_cik}",
+        cusip="67066G104",
+        issuer_name="NVIDIA CORP",
+        title_of_class="COM",
+        value_thousands=100_000,
+        value_usd=100_000_000,
+        shares=1000,
+        shares_type="SH",
+        put_call=None,
+        investment_discretion="SOLE",
+        voting_sole=1000,
+        voting_shared=0,
+        voting_none=0,
+        report_period="2025-03-31",
+    )
+
+
+class TestGetAllStockQuarters:
+    def test_empty(self, config):
+        assert get_all_stock_quarters(config) == {}
+
+    def test_matches_per_stock_lookup(self, config):
+        for ticker, quarter in [("nvda", "2025Q1"), ("NVDA", "2025Q2"), ("AAPL", "2024Q4")]:
+            save_stock_holdings(ticker, quarter, [], config)
+
+        stored = get_all_stock_quarters(config)
+        assert stored == {"NVDA": {"2025Q1", "2025Q2"}, "AAPL": {"2024Q4"}}
+        for ticker, quarters in stored.items():
+            assert quarters == set(get_stock_quarters(ticker, config))
+
+    def test_skips_invalid_names(self, config):
+        save_stock_holdings("NVDA", "2025Q1", [], config)
+        data_dir = get_stock_data_dir(config)
+        (data_dir / "NVDA" / "2025Q2.bak.json").write_text("{}")
+        (data_dir / "NVDA" / "notes.txt").write_text("")
+        (data_dir / "bad ticker").mkdir()
+        (data_dir / "bad ticker" / "2025Q1.json").write_text("{}")
+
+        assert get_all_stock_quarters(config) == {"NVDA": {"2025Q1"}}
+
+
+class TestStockMetadata:
+    def test_counts_unique_holders(self, config):
+        add_tracked_stock("NVDA", "67066G104", "NVIDIA CORP", config)
+        save_stock_holdings("NVDA", "2025Q1", [_holding("1"), _holding("2")], config)
+        save_stock_holdings("NVDA", "2025Q2", [_holding("2"), _holding("3")], config)
+
+        stock = get_tracked_stock("NVDA", config)
+        assert (stock.quarters_stored, stock.total_holders) == (2, 3)
+
+        # Overwriting a quarter recounts from its new contents
+        save_stock_holdings("NVDA", "2025Q1", [], config)
+        assert get_tracked_stock("NVDA", config).total_holders == 2
+
+    def test_remove_forgets_cached_holders(self, config):
+        add_tracked_stock("NVDA", "67066G104", "NVIDIA CORP", config)
+        add_tracked_stock("AAPL", "037833100", "APPLE INC", config)
+        save_stock_holdings("NVDA", "2025Q1", [_holding("1")], config)
+        save_stock_holdings("AAPL", "2025Q1", [_holding("2")], config)
+
+        remove_tracked_stock("NVDA", config)
+        cached = [path for path in _HOLDER_CIKS_CACHE if path.is_relative_to(config.data_dir)]
+        assert [path.parent.name for path in cached] == ["AAPL"]
@@ -0,0 +1,120 @@
+"""Tests for SEC EDGAR submissions lookup."""
+
+import pytest
+
+from thirteen_f.edgar.submissions import (
+    find_info_table_filename,
+    get_13f_filings,
+    lookup_cik_by_name,
+    period_to_quarter,
+)
+
+
+class _IndexClient:
+    """Serves a filing index page listing the given documents."""
+
+    def __init__(self, *hrefs: str) -> None:
+        self.html = "".join(f'<a href="{href}">{href}</a>' for href in hrefs)
+
+    def get_filing_index(self, cik: str, accession_number: str) -> str:
+        return self.html
+
+
+class _SubmissionsClient:
+    """Serves submissions listing the given (form, filing date, period) filings."""
+
+    def __init__(self, *filings: tuple[str, str, str]) -> None:
+        self.recent = {
+            "form": [form for form, _, _ in filings],
+            "accessionNumber": [f"0000000001-25-{i:06d}" for i in range(len(filings))],
+            "filingDate": [filed for _, filed, _ in filings],
+            "primaryDocument": ["primary_doc.xml"] * len(filings),
+            "reportDate": [period for _, _, period in filings],
+        }
+
+    def get_submissions(self, cik: str, **kwargs) -> dict:
+        return {"filings": {"recent": self.recent}}
+
+
+def _find(*hrefs: str) -> str | None:
+    return find_info_table_filename(_IndexClient(*hrefs), "1", "0000000001-25-000001")
+
+
+class TestFindInfoTableFilename:
+    def test_prefers_info_table(self):
+        assert _find("/a/primary_doc.xml", "/a/form13f_1.xml", "/a/InfoTable.XML") == (
+            "InfoTable.XML"
+        )
+
+    def test_prefers_form13f_over_other_xml(self):
+        assert _find("/a/holdings.xml", "/a/Form13F_2025.xml") == "Form13F_2025.xml"
+
+    def test_falls_back_to_first_non_primary(self):
+        assert _find("/a/primary_doc.xml", "/a/holdings.xml", "/a/other.xml") == "holdings.xml"
+
+    def test_skips_xsl_renderings(self):
+        assert _find("/a/xslForm13F_X02/infotable.xml", "/a/primary_doc.xml") is None
+
+    def test_duplicate_links_listed_once(self):
+        assert _find("/a/primary_doc.xml", "/b/primary_doc.xml", "/a/holdings.xml") == (
+            "holdings.xml"
+        )
+
+
+class TestGet13FFilings:
+    FILINGS = (
+        ("13F-HR/A", "2025-06-01", "2025-03-31"),
+        ("13F-HR", "2025-05-15", "2025-03-31"),
+        ("10-K", "2025-03-01", "2024-12-31"),
+        ("13F-HR", "2025-02-14", "2024-12-31"),
+        ("13F-HR", "2025-02-20", "2024-12-31"),
+        ("13F-HR", "2024-11-14", "2024-09-30"),
+    )
+
+    def _get(self, **kwargs) -> list[tuple[str, str]]:
+        client = _SubmissionsClient(*self.FILINGS)
+        return [
+            (f.period_of_report, f.filing_date) for f in get_13f_filings(client, "1", **kwargs)
+        ]
+
+    def test_latest_filing_per_period(self):
+        assert self._get() == [
+            ("2025-03-31", "2025-06-01"),
+            ("2024-12-31", "2025-02-20"),
+            ("2024-09-30", "2024-11-14"),
+        ]
+
+    def test_original_only_and_periods(self):
+        assert self._get(original_only=True, periods=2) == [
+            ("2025-03-31", "2025-05-15"),
+            ("2024-12-31", "2025-02-20"),
+        ]
+
+
+class TestPeriodToQuarter:
+    def test_quarters(self):
+        assert [period_to_quarter(p) for p in ["2025-03-31", "2025-06-30", "2024-12-31"]] == [
+            "2025Q1",
+            "2025Q2",
+            "2024Q4",
+        ]
+
+    def test_invalid_date(self):
+        with pytest.raises(ValueError):
+            period_to_quarter("2025-13-31")
+
+
+class TestLookupCikByName:
+    def test_query_is_url_encoded(self):
+        urls = []
+
+        class _SearchClient:
+            def get_json(self, url: str, use_cache: bool = True) -> dict:
+                urls.append(url)
+                hit = {"_source": {"ciks": ["0001336528"], "display_names": ["Pershing Square"]}}
+                return {"hits": {"hits": [hit]}}
+
+        assert lookup_cik_by_name(_SearchClient(), "Pershing Square & Co") == [
+            ("0001336528", "Pershing Square")
+        ]
+        assert "?q=Pershing+Square+%26+Co&" in urls[0]